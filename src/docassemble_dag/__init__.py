@@ -45,6 +45,7 @@ from .reconsider import (
 )
 from .types import DependencyType, Edge, Node, NodeKind
 from .utils import (
+    find_nodes_by_authorities,
     find_nodes_by_authority,
     find_yaml_files,
     merge_graphs,
@@ -114,6 +115,7 @@ __all__ = [
     "merge_graphs",
     "parse_multiple_files",
     "find_nodes_by_authority",
+    "find_nodes_by_authorities",
     "parse_with_includes",
     "create_schema", 
     "create_server"
@@ -7,10 +7,9 @@ regex-based approaches.
 """
 
 import ast
+import functools
 import logging
-from typing import Set, Tuple
-
-from .exceptions import ParsingError
+from typing import FrozenSet, List, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -138,53 +137,74 @@ def extract_variables_from_python_ast(code: str) -> Tuple[Set[str], Set[str], Se
         )
         return set(), set(), set()
     
+    variables, objects, attributes = _analyze_code(code)
+    return set(variables), set(objects), set(attributes)
+
+
+@functools.lru_cache(maxsize=4096)
+def _analyze_code(code: str) -> Tuple[FrozenSet[str], FrozenSet[str], FrozenSet[Tuple[str, str]]]:
+    """
+    Parse and walk a code block, memoized by its source text.
+    
+    Interviews repeat the same code and expressions across questions and
+    files, so a cache hit skips both ast.parse and the visitor walk. Results
+    are frozen so cached entries cannot be mutated by callers.
+    """
+    empty: Tuple[FrozenSet[str], FrozenSet[str], FrozenSet[Tuple[str, str]]] = (
+        frozenset(), frozenset(), frozenset()
+    )
+    
     try:
         tree = ast.parse(code, mode='exec')
     except SyntaxError as e:
         logger.debug(f"Failed to parse Python code as AST: {e}. Falling back to regex.")
-        return set(), set(), set()
+        return empty
     except RecursionError:
         logger.warning("Recursion error parsing AST - code too complex or nested")
-        return set(), set(), set()
+        return empty
     except Exception as e:
         logger.warning(f"Unexpected error parsing Python AST: {e}")
-        return set(), set(), set()
+        return empty
+    
+    # Count AST nodes and measure depth to prevent resource exhaustion,
+    # collecting references in the same walk (same result as VariableVisitor,
+    # without its per-node visit_* method dispatch). The tree is walked one
+    # level at a time, so depth is known without a second recursive pass.
+    variables: Set[str] = set()
+    objects: Set[str] = set()
+    attributes: Set[Tuple[str, str]] = set()
+    node_count = 0
+    ast_depth = -1
+    iter_child_nodes = ast.iter_child_nodes
+    level: List[ast.AST] = [tree]
+    while level:
+        ast_depth += 1
+        node_count += len(level)
+        next_level: List[ast.AST] = []
+        for node in level:
+            if type(node) is ast.Name:
+                if isinstance(node.ctx, ast.Load):
+                    variables.add(node.id)
+            elif type(node) is ast.Attribute:
+                value = node.value
+                if type(value) is ast.Name:
+                    objects.add(value.id)
+                    attributes.add((value.id, node.attr))
+            next_level.extend(iter_child_nodes(node))
+        level = next_level
     
-    # Count AST nodes to prevent resource exhaustion
-    node_count = len(list(ast.walk(tree)))
     if node_count > MAX_AST_NODES:
         logger.warning(
             f"AST too large: {node_count} nodes (max {MAX_AST_NODES}). "
             "Skipping AST parsing."
         )
-        return set(), set(), set()
-    
-    # Check AST depth
-    def get_ast_depth(node: ast.AST, current_depth: int = 0) -> int:
-        """Calculate maximum depth of AST."""
-        if current_depth > MAX_AST_DEPTH:
-            raise ParsingError(
-                f"AST depth exceeds maximum {MAX_AST_DEPTH}. "
-                "Code is too deeply nested."
-            )
-        
-        max_depth = current_depth
-        for child in ast.iter_child_nodes(node):
-            max_depth = max(max_depth, get_ast_depth(child, current_depth + 1))
-        return max_depth
-    
-    try:
-        ast_depth = get_ast_depth(tree)
-        if ast_depth > MAX_AST_DEPTH:
-            logger.warning(f"AST depth {ast_depth} exceeds maximum {MAX_AST_DEPTH}")
-            return set(), set(), set()
-    except ParsingError:
-        return set(), set(), set()
+        return empty
     
-    visitor = VariableVisitor()
-    visitor.visit(tree)
+    if ast_depth > MAX_AST_DEPTH:
+        logger.debug(f"AST depth {ast_depth} exceeds maximum {MAX_AST_DEPTH}")
+        return empty
     
-    return visitor.variables, visitor.objects, visitor.attributes
+    return frozenset(variables), frozenset(objects), frozenset(attributes)
 
 
 def should_use_ast_parsing(text: str) -> bool:
@@ -366,10 +366,8 @@ Examples:
         graph_id = input_path.stem if input_path.is_file() else input_path.name.replace('/', '_')
         output_text = graph.to_graphml(graph_id=graph_id)
     else:
-        struct = graph.to_json_struct()
         # Pretty print by default (unless --no-pretty is specified)
-        indent = 2 if args.pretty else None
-        output_text = json.dumps(struct, indent=indent, ensure_ascii=False)
+        output_text = graph.to_json_bytes(pretty=args.pretty).decode("utf-8")
     
     if args.serve_graphql:
         from .graphql.server import serve
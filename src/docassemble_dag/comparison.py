@@ -9,9 +9,9 @@ Enables comparing two dependency graphs to identify:
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Optional, Any
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from .graph import DependencyGraph
+from .graph import DependencyGraph, _ids_from_bits
 from .types import Node, Edge, NodeKind
 
 
@@ -96,23 +96,27 @@ def compare_graphs(old_graph: DependencyGraph, new_graph: DependencyGraph) -> Gr
     """
     diff = GraphDiff()
     
-    old_node_names = set(old_graph.nodes.keys())
-    new_node_names = set(new_graph.nodes.keys())
+    old_nodes = old_graph.nodes
+    new_nodes = new_graph.nodes
     
     # Find added nodes
-    added_names = new_node_names - old_node_names
-    diff.added_nodes = [new_graph.nodes[name] for name in added_names]
+    diff.added_nodes = [node for name, node in new_nodes.items() if name not in old_nodes]
     
-    # Find removed nodes
-    removed_names = old_node_names - new_node_names
-    diff.removed_nodes = [old_graph.nodes[name] for name in removed_names]
+    # Partition old nodes into removed and shared in a single pass;
+    # only shared nodes that are not equal need a field-by-field compare.
+    # Graph versions often reuse Node objects, so try identity before __eq__
+    removed_names: List[str] = []
+    changed_pairs: List[Tuple[str, Node, Node]] = []
+    for name, old_node in old_nodes.items():
+        new_node = new_nodes.get(name)
+        if new_node is None:
+            removed_names.append(name)
+            diff.removed_nodes.append(old_node)
+        elif old_node is not new_node and old_node != new_node:
+            changed_pairs.append((name, old_node, new_node))
     
     # Find changed nodes (same name, different properties)
-    common_names = old_node_names & new_node_names
-    for name in common_names:
-        old_node = old_graph.nodes[name]
-        new_node = new_graph.nodes[name]
-        
+    for name, old_node, new_node in changed_pairs:
         # Check for changes in node properties
         changes: Dict[str, Any] = {"name": name}
         has_changes = False
@@ -146,23 +150,17 @@ def compare_graphs(old_graph: DependencyGraph, new_graph: DependencyGraph) -> Gr
         if has_changes:
             diff.changed_nodes.append(changes)
     
-    # Compare edges
-    old_edges_set = _edges_to_set(old_graph.edges)
-    new_edges_set = _edges_to_set(new_graph.edges)
+    # Compare edges: key each edge once, then diff the key sets
+    old_keyed = [(_edge_to_key(edge), edge) for edge in old_graph.edges]
+    new_keyed = [(_edge_to_key(edge), edge) for edge in new_graph.edges]
+    old_edge_keys = {key for key, _ in old_keyed}
+    new_edge_keys = {key for key, _ in new_keyed}
     
     # Find added edges
-    added_edge_keys = new_edges_set - old_edges_set
-    diff.added_edges = [
-        edge for edge in new_graph.edges
-        if _edge_to_key(edge) in added_edge_keys
-    ]
+    diff.added_edges = [edge for key, edge in new_keyed if key not in old_edge_keys]
     
     # Find removed edges
-    removed_edge_keys = old_edges_set - new_edges_set
-    diff.removed_edges = [
-        edge for edge in old_graph.edges
-        if _edge_to_key(edge) in removed_edge_keys
-    ]
+    diff.removed_edges = [edge for key, edge in old_keyed if key not in new_edge_keys]
     
     # Calculate affected nodes (downstream impact analysis)
     # Nodes affected by:
@@ -173,27 +171,23 @@ def compare_graphs(old_graph: DependencyGraph, new_graph: DependencyGraph) -> Gr
     
     # Find nodes that depend on removed nodes
     # Only if removed nodes exist in new graph (they shouldn't, but check anyway)
-    for removed_name in removed_names:
-        if removed_name in new_graph.nodes:
-            dependents = new_graph.get_transitive_dependents(removed_name)
-            affected.update(dependents)
+    seeds = [name for name in removed_names if name in new_nodes]
     
     # Find nodes affected by removed edges
     for removed_edge in diff.removed_edges:
-        if removed_edge.to_node in new_node_names:
+        if removed_edge.to_node in new_nodes:
             affected.add(removed_edge.to_node)
-            # Also include transitive dependents
-            dependents = new_graph.get_transitive_dependents(removed_edge.to_node)
-            affected.update(dependents)
     
     # Find nodes affected by changed nodes (authority changes, etc.)
     for change in diff.changed_nodes:
         node_name = change["name"]
-        if node_name in new_node_names:
+        if node_name in new_nodes:
             affected.add(node_name)
-            # Include transitive dependents
-            dependents = new_graph.get_transitive_dependents(node_name)
-            affected.update(dependents)
+    
+    # Include transitive dependents of all seeds in one traversal
+    seeds.extend(affected)
+    if seeds:
+        affected.update(new_graph.get_transitive_dependents_of(seeds))
     
     diff.affected_nodes = affected
     
@@ -205,11 +199,6 @@ def _edge_to_key(edge: Edge) -> tuple:
     return (edge.from_node, edge.to_node, edge.dep_type.value)
 
 
-def _edges_to_set(edges: List[Edge]) -> Set[tuple]:
-    """Convert list of edges to set of keys."""
-    return {_edge_to_key(edge) for edge in edges}
-
-
 def get_change_impact(
     graph: DependencyGraph,
     changed_node_names: Set[str]
@@ -233,11 +222,70 @@ def get_change_impact(
     """
     impact: Dict[str, List[str]] = {}
     
-    for node_name in changed_node_names:
-        if node_name not in graph.nodes:
-            continue
-        
-        dependents = graph.get_transitive_dependents(node_name)
-        impact[node_name] = sorted(list(dependents))
+    seeds = [name for name in changed_node_names if name in graph.nodes]
+    
+    # With several changed nodes their downstream sets usually overlap, so
+    # compute them together in one pass instead of one traversal per node,
+    # unless the graph already holds precomputed closures to read them from
+    if len(seeds) > 1 and graph._closure_bits is None:
+        closure = _dependents_closure(graph, seeds)
+    else:
+        closure = None
+    
+    for node_name in seeds:
+        if closure is not None:
+            dependents = closure[node_name]
+        else:
+            dependents = graph.get_transitive_dependents(node_name)
+        impact[node_name] = sorted(dependents)
     
     return impact
+
+
+def _dependents_closure(graph: DependencyGraph, seeds: List[str]) -> Optional[Dict[str, Set[str]]]:
+    """
+    Compute transitive dependents for each of seeds.
+    
+    Visits the reachable subgraph once in post-order (dependents before the
+    nodes they depend on), so each node's result is the union of its direct
+    dependents and their already-computed results.
+    
+    Returns:
+        Mapping of seed name to its transitive dependents, or None if the
+        reachable subgraph contains a cycle (callers fall back to per-node DFS)
+    """
+    adj = graph.adj
+    order: List[str] = []
+    state: Dict[str, bool] = {}  # False while on the DFS stack, True once finished
+    
+    for seed in seeds:
+        if seed in state:
+            continue
+        state[seed] = False
+        stack = [(seed, iter(adj.get(seed, ())))]
+        while stack:
+            node, children = stack[-1]
+            for child in children:
+                finished = state.get(child)
+                if finished is None:
+                    state[child] = False
+                    stack.append((child, iter(adj.get(child, ()))))
+                    break
+                if not finished:
+                    return None  # Back edge: cycle
+            else:
+                stack.pop()
+                state[node] = True
+                order.append(node)
+    
+    # Represent each node's dependents as a bitmask over post-order positions,
+    # so every union is a single int OR instead of a set merge
+    position = {node: i for i, node in enumerate(order)}
+    masks: List[int] = []
+    for node in order:
+        mask = 0
+        for child in adj.get(node, ()):
+            mask |= masks[position[child]] | (1 << position[child])
+        masks.append(mask)
+    
+    return {seed: {order[i] for i in _ids_from_bits(masks[position[seed]])} for seed in seeds}
@@ -5,11 +5,13 @@ Generates audit-ready reports with statute citations, authority verification,
 and change impact analysis.
 """
 
+import functools
 import logging
+import sys
 from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 from .comparison import GraphDiff, compare_graphs
 from .graph import DependencyGraph
@@ -18,6 +20,17 @@ from .types import NodeKind
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4096)
+def _split_authority(authority: str) -> Tuple[str, ...]:
+    """
+    Split a comma-separated authority string into stripped citations.
+    
+    Citations are interned, so a statute cited from many different
+    authority strings is one shared key in the authority mapping.
+    """
+    return tuple(sys.intern(a.strip()) for a in authority.split(','))
+
+
 class ComplianceReport:
     """Compliance report for an interview."""
     
@@ -43,36 +56,45 @@ class ComplianceReport:
         # Analysis results
         self.authority_mapping: Dict[str, List[str]] = defaultdict(list)
         self.missing_authorities: List[str] = []
-        self.change_summary: Optional[Dict] = None
+        
+        # Baseline comparison is computed on first access of change_summary
+        self._change_summary: Optional[Dict] = None
+        self._change_summary_ready = False
         
         self._analyze()
     
     def _analyze(self) -> None:
         """Perform compliance analysis."""
-        # Map statute citations to nodes
+        # Map statute citations to nodes and find nodes without authority
         for node in self.graph.nodes.values():
             if node.authority:
-                authorities = [a.strip() for a in node.authority.split(',')]
-                for authority in authorities:
+                for authority in _split_authority(node.authority):
                     self.authority_mapping[authority].append(node.name)
-        
-        # Find nodes without authority
-        for node in self.graph.nodes.values():
-            if not node.authority and node.kind in (NodeKind.VARIABLE, NodeKind.RULE):
+            elif node.kind in (NodeKind.VARIABLE, NodeKind.RULE):
                 # Derived variables and rules should have authority
                 if node.source == "derived":
                     self.missing_authorities.append(node.name)
+    
+    @property
+    def change_summary(self) -> Optional[Dict]:
+        """
+        Summary of changes against the baseline graph, or None without one.
         
-        # Compare with baseline if provided
-        if self.baseline_graph:
-            diff = compare_graphs(self.baseline_graph, self.graph)
-            self.change_summary = {
-                "added_nodes": len(diff.added_nodes),
-                "removed_nodes": len(diff.removed_nodes),
-                "changed_nodes": len(diff.changed_nodes),
-                "authority_changes": len(diff.authority_changes),
-                "affected_nodes": len(diff.affected_nodes),
-            }
+        The graph comparison only runs the first time this is accessed.
+        """
+        if not self._change_summary_ready:
+            # Compare with baseline if provided
+            if self.baseline_graph:
+                diff = compare_graphs(self.baseline_graph, self.graph)
+                self._change_summary = {
+                    "added_nodes": len(diff.added_nodes),
+                    "removed_nodes": len(diff.removed_nodes),
+                    "changed_nodes": len(diff.changed_nodes),
+                    "authority_changes": len(diff.authority_changes),
+                    "affected_nodes": len(diff.affected_nodes),
+                }
+            self._change_summary_ready = True
+        return self._change_summary
     
     def to_html(self, output_path: Optional[Path] = None) -> str:
         """
@@ -84,7 +106,7 @@ class ComplianceReport:
         Returns:
             HTML content as string
         """
-        html = f"""<!DOCTYPE html>
+        parts: List[str] = [f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -180,11 +202,11 @@ class ComplianceReport:
             <strong>Total Edges:</strong> {len(self.graph.edges)}<br>
             <strong>Statute Citations:</strong> {len(self.authority_mapping)}
         </div>
-"""
+"""]
         
         # Change summary
         if self.change_summary:
-            html += f"""
+            parts.append(f"""
         <div class="change-summary">
             <h2>Change Summary (vs. Baseline)</h2>
             <ul>
@@ -195,47 +217,52 @@ class ComplianceReport:
                 <li>Affected Nodes: {self.change_summary['affected_nodes']}</li>
             </ul>
         </div>
-"""
+""")
         
         # Statute citations
-        html += """
+        parts.append("""
         <h2>Statute Citations</h2>
-"""
+""")
         for statute, node_names in sorted(self.authority_mapping.items()):
-            html += f"""
+            parts.append(f"""
         <div class="statute-section">
             <div class="statute-name">{statute}</div>
             <ul class="node-list">
-"""
+""")
             for node_name in sorted(node_names):
                 node = self.graph.nodes.get(node_name)
                 if node:
-                    html += f'                <li class="node-item">{node_name} ({node.kind.value})</li>\n'
-            html += """
+                    parts.append(
+                        f'                <li class="node-item">'
+                        f'{node_name} ({node.kind.value})</li>\n'
+                    )
+            parts.append("""
             </ul>
         </div>
-"""
+""")
         
         # Missing authorities
         if self.missing_authorities:
-            html += f"""
+            parts.append(f"""
         <div class="warning">
             <h2>Missing Authority Warnings</h2>
             <p>The following {len(self.missing_authorities)} derived variables/rules lack authority citations:</p>
             <ul>
-"""
+""")
             for node_name in sorted(self.missing_authorities):
-                html += f"                <li>{node_name}</li>\n"
-            html += """
+                parts.append(f"                <li>{node_name}</li>\n")
+            parts.append("""
             </ul>
         </div>
-"""
+""")
         
-        html += """
+        parts.append("""
     </div>
 </body>
 </html>
-"""
+""")
+        
+        html = "".join(parts)
         
         if output_path:
             output_path = Path(output_path)
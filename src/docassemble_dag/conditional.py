@@ -5,6 +5,7 @@ Extracts conditional dependencies from `show if:`, `enable if:`, `required if:`,
 and other conditional directives that create implicit dependencies.
 """
 
+import ast
 import logging
 import re
 from typing import Dict, List, Optional, Set
@@ -20,6 +21,16 @@ CONDITIONAL_PATTERN = re.compile(
     re.IGNORECASE | re.MULTILINE
 )
 
+# Simple variable name pattern for the regex fallback
+_IDENTIFIER_PATTERN = re.compile(r'\b([a-zA-Z_][a-zA-Z0-9_]*)\b')
+
+# Python keywords and builtins that are never interview variables
+_EXCLUDED_NAMES = frozenset({
+    'and', 'or', 'not', 'in', 'is', 'if', 'else', 'elif',
+    'True', 'False', 'None', 'len', 'str', 'int', 'float',
+    'bool', 'list', 'dict', 'set', 'tuple',
+})
+
 
 class ConditionalDependency:
     """
@@ -53,7 +64,8 @@ class ConditionalDependency:
     
     def _extract_dependencies(self) -> None:
         """Extract variable dependencies from the conditional expression."""
-        # Use AST parsing for complex conditions, regex for simple ones
+        # Use statement-level AST parsing for code blocks, an expression
+        # parse for simple conditions, and regex if neither parses
         if should_use_ast_parsing(self.condition):
             try:
                 variables, objects, _ = extract_variables_from_python_ast(self.condition)
@@ -63,23 +75,32 @@ class ConditionalDependency:
                 logger.debug(f"AST parsing failed for condition '{self.condition}': {e}. Using regex.")
                 self._extract_with_regex()
         else:
-            self._extract_with_regex()
+            try:
+                tree = ast.parse(self.condition, mode='eval')
+            except SyntaxError:
+                self._extract_with_regex()
+            else:
+                self._extract_from_expression(tree)
+    
+    def _extract_from_expression(self, tree: ast.AST) -> None:
+        """
+        Extract variable dependencies from a parsed expression.
+        
+        Only ast.Name nodes are collected, so attribute access (person.age)
+        contributes its root object and string literals, True/False/None and
+        operators never appear as dependencies.
+        """
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name):
+                name = node.id
+                if name.lower() not in _EXCLUDED_NAMES and not name[0].isupper():
+                    self.dependencies.add(name)
     
     def _extract_with_regex(self) -> None:
         """Extract variable dependencies using regex as fallback."""
-        # Simple variable name pattern
-        var_pattern = re.compile(r'\b([a-zA-Z_][a-zA-Z0-9_]*)\b')
-        
-        # Python keywords and operators to exclude
-        excluded = {
-            'and', 'or', 'not', 'in', 'is', 'if', 'else', 'elif',
-            'True', 'False', 'None', 'len', 'str', 'int', 'float',
-            'bool', 'list', 'dict', 'set', 'tuple',
-        }
-        
-        matches = var_pattern.findall(self.condition)
+        matches = _IDENTIFIER_PATTERN.findall(self.condition)
         for match in matches:
-            if match.lower() not in excluded and not match[0].isupper():
+            if match.lower() not in _EXCLUDED_NAMES and not match[0].isupper():
                 # Skip Python built-ins and keywords
                 self.dependencies.add(match)
 
@@ -7,10 +7,67 @@ Supports both SQLite and PostgreSQL with a unified interface.
 import logging
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
-from typing import Any, Dict, Iterator, List, Optional, Protocol
+from typing import (
+    TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Protocol, Sequence, cast
+)
+
+if TYPE_CHECKING:
+    import sqlite3
 
 logger = logging.getLogger(__name__)
 
+# Performance pragmas applied to file-backed SQLite connections
+_SQLITE_FILE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+)
+
+# SQLite schema (tables and indexes), applied with one executescript() call
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS graphs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    version TEXT,
+    file_path TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    metadata TEXT
+);
+
+CREATE TABLE IF NOT EXISTS nodes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    graph_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    source TEXT NOT NULL,
+    authority TEXT,
+    file_path TEXT,
+    line_number INTEGER,
+    metadata TEXT,
+    FOREIGN KEY (graph_id) REFERENCES graphs(id) ON DELETE CASCADE,
+    UNIQUE(graph_id, name)
+);
+
+CREATE TABLE IF NOT EXISTS edges (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    graph_id INTEGER NOT NULL,
+    from_node TEXT NOT NULL,
+    to_node TEXT NOT NULL,
+    dep_type TEXT NOT NULL,
+    file_path TEXT,
+    line_number INTEGER,
+    metadata TEXT,
+    FOREIGN KEY (graph_id) REFERENCES graphs(id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_nodes_graph ON nodes(graph_id);
+CREATE INDEX IF NOT EXISTS idx_nodes_name ON nodes(name);
+CREATE INDEX IF NOT EXISTS idx_edges_graph ON edges(graph_id);
+CREATE INDEX IF NOT EXISTS idx_edges_from ON edges(from_node);
+CREATE INDEX IF NOT EXISTS idx_edges_to ON edges(to_node);
+"""
+
 
 class DBCursor(Protocol):
     """Protocol for database cursor objects."""
@@ -19,6 +76,10 @@ class DBCursor(Protocol):
         """Execute a query."""
         ...
     
+    def executemany(self, query: str, params_seq: Iterable[tuple]) -> None:
+        """Execute a query once per parameter tuple."""
+        ...
+    
     def fetchall(self) -> List[Any]:
         """Fetch all results."""
         ...
@@ -94,13 +155,43 @@ class DatabaseBackend(ABC):
     def get_row_accessor(self, row: Any, key: str) -> Any:
         """Get value from database row (handles row factory differences)."""
         pass
+    
+    def insert_rows(
+        self,
+        cursor: DBCursor,
+        table: str,
+        columns: Sequence[str],
+        rows: Iterable[tuple],
+    ) -> None:
+        """
+        Insert many rows into a table with a single batched call.
+        
+        Args:
+            cursor: Cursor inside the caller's transaction
+            table: Table name
+            columns: Column names, in the order of each row tuple
+            rows: Row tuples to insert
+        """
+        placeholders = ", ".join([self.get_placeholder()] * len(columns))
+        cursor.executemany(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})",
+            rows,
+        )
 
 
 class SQLiteBackend(DatabaseBackend):
     """SQLite database backend."""
     
     def connect(self, connection_string: str) -> DBConnection:
-        """Establish SQLite connection."""
+        """
+        Establish SQLite connection.
+        
+        File databases are switched to WAL journaling with
+        synchronous=NORMAL. journal_mode=WAL is stored in the database file,
+        so it persists for every later user of that file. With
+        synchronous=NORMAL the database is not corrupted by a crash, but the
+        most recent commits can be lost on power failure or an OS crash.
+        """
         import sqlite3
         
         # Handle :memory: and file paths
@@ -108,6 +199,11 @@ class SQLiteBackend(DatabaseBackend):
             conn = sqlite3.connect(":memory:")
         else:
             conn = sqlite3.connect(connection_string)
+            # WAL with synchronous=NORMAL avoids an fsync per commit; it keeps
+            # the file consistent, but the last commits may not survive a
+            # power failure. The pragmas are pointless for :memory:
+            for pragma in _SQLITE_FILE_PRAGMAS:
+                conn.execute(pragma)
         
         conn.row_factory = sqlite3.Row
         return conn
@@ -125,59 +221,13 @@ class SQLiteBackend(DatabaseBackend):
         return "CURRENT_TIMESTAMP"
     
     def create_schema(self, cursor: DBCursor) -> None:
-        """Create SQLite schema."""
-        placeholder = self.get_placeholder()
-        
-        # Graphs table
-        cursor.execute(f"""
-            CREATE TABLE IF NOT EXISTS graphs (
-                id {self.get_auto_increment()},
-                name TEXT NOT NULL,
-                version TEXT,
-                file_path TEXT,
-                created_at TIMESTAMP DEFAULT {self.get_timestamp_default()},
-                metadata TEXT
-            )
-        """)
-        
-        # Nodes table
-        cursor.execute(f"""
-            CREATE TABLE IF NOT EXISTS nodes (
-                id {self.get_auto_increment()},
-                graph_id INTEGER NOT NULL,
-                name TEXT NOT NULL,
-                kind TEXT NOT NULL,
-                source TEXT NOT NULL,
-                authority TEXT,
-                file_path TEXT,
-                line_number INTEGER,
-                metadata TEXT,
-                FOREIGN KEY (graph_id) REFERENCES graphs(id) ON DELETE CASCADE,
-                UNIQUE(graph_id, name)
-            )
-        """)
-        
-        # Edges table
-        cursor.execute(f"""
-            CREATE TABLE IF NOT EXISTS edges (
-                id {self.get_auto_increment()},
-                graph_id INTEGER NOT NULL,
-                from_node TEXT NOT NULL,
-                to_node TEXT NOT NULL,
-                dep_type TEXT NOT NULL,
-                file_path TEXT,
-                line_number INTEGER,
-                metadata TEXT,
-                FOREIGN KEY (graph_id) REFERENCES graphs(id) ON DELETE CASCADE
-            )
-        """)
+        """
+        Create SQLite schema in a single executescript() call.
         
-        # Create indexes
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_nodes_graph ON nodes(graph_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_nodes_name ON nodes(name)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_edges_graph ON edges(graph_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_edges_from ON edges(from_node)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_edges_to ON edges(to_node)")
+        executescript() is sqlite3-specific and not part of DBCursor; the
+        cursor always comes from a connection returned by connect().
+        """
+        cast("sqlite3.Cursor", cursor).executescript(_SQLITE_SCHEMA)
     
     def get_row_accessor(self, row: Any, key: str) -> Any:
         """SQLite Row objects support dictionary-like access."""
@@ -277,6 +327,28 @@ class PostgreSQLBackend(DatabaseBackend):
         # Last resort: try index access if row is tuple-like
         return row[key] if hasattr(row, '__getitem__') else None
     
+    def insert_rows(
+        self,
+        cursor: DBCursor,
+        table: str,
+        columns: Sequence[str],
+        rows: Iterable[tuple],
+    ) -> None:
+        """
+        Insert many rows using psycopg2's execute_values.
+        
+        psycopg2's executemany() runs one statement per row; execute_values
+        sends multi-row INSERTs of up to 1000 rows each.
+        """
+        from psycopg2.extras import execute_values
+        
+        execute_values(
+            cursor,
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES %s",
+            rows,
+            page_size=1000,
+        )
+    
     def connect(self, connection_string: str) -> DBConnection:
         """Establish PostgreSQL connection with RealDictCursor."""
         try:
@@ -6,7 +6,7 @@ and provides visualization capabilities.
 """
 
 import logging
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Tuple
 
 from .conditional import ConditionalDependency
 from .exceptions import GraphError
@@ -106,62 +106,35 @@ def extract_decision_tree(
     # Build decision nodes from conditional dependencies
     decision_nodes: Dict[str, DecisionNode] = {}
     
-    # Traverse graph to build decision tree
-    visited: Set[str] = set()
-    
-    def build_tree(node_name: str, depth: int = 0) -> DecisionNode:
-        """
-        Recursively build decision tree with depth limit.
-        
-        Args:
-            node_name: Name of node to build tree for
-            depth: Current recursion depth (for cycle detection)
-            
-        Returns:
-            DecisionNode for the given node
-            
-        Raises:
-            GraphError: If maximum depth exceeded
-        """
-        if depth > MAX_DECISION_TREE_DEPTH:
-            raise GraphError(
-                f"Maximum depth {MAX_DECISION_TREE_DEPTH} exceeded while building decision tree. "
-                "This may indicate a very deep or malformed graph."
-            )
-        
-        if node_name in visited:
-            # Already processed, return existing node
-            return decision_nodes.get(node_name, DecisionNode(name=node_name))
-        
-        visited.add(node_name)
-        
-        # Get or create decision node
-        if node_name in decision_nodes:
-            decision_node = decision_nodes[node_name]
-        else:
-            decision_node = DecisionNode(name=node_name)
-            decision_nodes[node_name] = decision_node
-        
-        # Find conditional dependencies for this node
+    def make_node(node_name: str) -> DecisionNode:
+        """Create the decision node for node_name, applying its conditionals."""
+        decision_node = DecisionNode(name=node_name)
         if conditionals and node_name in conditionals:
-            cond_deps = conditionals[node_name]
-            for cond_dep in cond_deps:
-                # Create decision branches based on condition
+            for cond_dep in conditionals[node_name]:
                 decision_node.condition = cond_dep.condition
-        
-        # Find children (dependents) from graph - these are nodes that depend on this node
-        dependents = graph.get_dependents(node_name)
-        for dep_name in dependents:
-            if dep_name not in visited:  # Only process if not already visited
-                child = build_tree(dep_name)
-                # Avoid duplicate children
-                if not any(c.name == child.name for c in decision_node.children):
-                    decision_node.children.append(child)
-        
+        decision_nodes[node_name] = decision_node
         return decision_node
     
-    # Build tree starting from root
-    root_decision = build_tree(root_node_name)
+    # Traverse graph depth-first with an explicit stack. Each node becomes a
+    # child of the node that first reaches it, so diamonds appear only once
+    root_decision = make_node(root_node_name)
+    stack = [(root_decision, iter(graph.get_dependents(root_node_name)))]
+    
+    while stack:
+        parent, dependents = stack[-1]
+        for dep_name in dependents:
+            if dep_name not in decision_nodes:
+                if len(stack) > MAX_DECISION_TREE_DEPTH:
+                    raise GraphError(
+                        f"Maximum depth {MAX_DECISION_TREE_DEPTH} exceeded while building "
+                        "decision tree. This may indicate a very deep or malformed graph."
+                    )
+                child = make_node(dep_name)
+                parent.children.append(child)
+                stack.append((child, iter(graph.get_dependents(dep_name))))
+                break
+        else:
+            stack.pop()
     
     return DecisionTree(root=root_decision, nodes=decision_nodes)
 
@@ -182,8 +155,12 @@ def decision_tree_to_dot(tree: DecisionTree, title: str = "Decision Tree") -> st
     lines.append("  rankdir=TB;")
     lines.append("  node [shape=box];")
     
-    def add_node(node: DecisionNode, parent: Optional[str] = None) -> None:
-        """Recursively add nodes and edges."""
+    # Walk the tree in pre-order with an explicit stack (trees can be up to
+    # MAX_DECISION_TREE_DEPTH deep); branches are pushed in reverse so they
+    # are emitted true branch, false branch, then children in order
+    stack: List[Tuple[DecisionNode, Optional[str]]] = [(tree.root, None)]
+    while stack:
+        node, parent = stack.pop()
         node_id = node.name.replace(' ', '_').replace('-', '_')
         
         label = node.name
@@ -195,14 +172,9 @@ def decision_tree_to_dot(tree: DecisionTree, title: str = "Decision Tree") -> st
         if parent:
             lines.append(f'  "{parent}" -> "{node_id}";')
         
-        if node.true_branch:
-            add_node(node.true_branch, node_id)
-        if node.false_branch:
-            add_node(node.false_branch, node_id)
-        for child in node.children:
-            add_node(child, node_id)
+        branches = [node.true_branch, node.false_branch] + node.children
+        stack.extend((child, node_id) for child in reversed(branches) if child)
     
-    add_node(tree.root)
     lines.append("}")
     
     return "\n".join(lines)
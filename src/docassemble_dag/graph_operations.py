@@ -5,12 +5,75 @@ Provides topological sort, execution order, and other graph algorithms
 that are commonly needed for legaltech workflows.
 """
 
-from typing import List, Set, Optional
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
 
 from .exceptions import CycleError, GraphError
 from .graph import DependencyGraph
 
 
+def _layered_kahn(
+    graph: DependencyGraph,
+    start_nodes: List[str],
+) -> Tuple[List[str], List[List[str]]]:
+    """
+    Run Kahn's algorithm with a FIFO ready queue, tracking each node's layer.
+    
+    start_nodes form layer 0 regardless of their dependencies. Every other
+    node is emitted once all of its dependencies have been, in the layer
+    after its latest dependency (layer 1 for other nodes with no
+    dependencies). The queue only ever holds two consecutive layers, in
+    order, so a node's layer is fixed when it is freed.
+    
+    Args:
+        graph: DependencyGraph to traverse
+        start_nodes: Names of the nodes to emit first
+        
+    Returns:
+        Tuple of (order, layers): emitted node names in dequeue order, and
+        the same names grouped by layer. Nodes that are never freed (on or
+        behind a cycle, or depending on names outside the graph) are in
+        neither.
+    """
+    rev = graph.rev
+    in_degree: Dict[str, int] = {name: len(rev.get(name, ())) for name in graph.nodes}
+    layer_of: Dict[str, int] = {}
+    queue: Deque[str] = deque()
+    
+    for name in start_nodes:
+        if name not in layer_of:
+            layer_of[name] = 0
+            queue.append(name)
+    if queue:
+        for name, degree in in_degree.items():
+            if degree == 0 and name not in layer_of:
+                layer_of[name] = 1
+                queue.append(name)
+    
+    order: List[str] = []
+    layers: List[List[str]] = []
+    while queue:
+        node = queue.popleft()
+        order.append(node)
+        layer = layer_of[node]
+        if layer == len(layers):
+            layers.append([])
+        layers[layer].append(node)
+        
+        # Update in-degrees of dependents; names outside the graph and
+        # start nodes (already emitted) are skipped
+        for dependent in graph.get_dependents(node):
+            degree = in_degree.get(dependent)
+            if degree is None or dependent in layer_of:
+                continue
+            in_degree[dependent] = degree - 1
+            if degree == 1:
+                layer_of[dependent] = layer + 1
+                queue.append(dependent)
+    
+    return order, layers
+
+
 def topological_sort(graph: DependencyGraph) -> List[str]:
     """
     Return nodes in topological order (dependencies before dependents).
@@ -38,26 +101,8 @@ def topological_sort(graph: DependencyGraph) -> List[str]:
             cycles=cycles,
         )
     
-    # Kahn's algorithm
-    # Calculate in-degree for each node
-    in_degree: dict[str, int] = {node: 0 for node in graph.nodes}
-    for edge in graph.edges:
-        in_degree[edge.to_node] += 1
-    
-    # Queue of nodes with no incoming edges
-    queue: List[str] = [node for node, degree in in_degree.items() if degree == 0]
-    result: List[str] = []
-    
-    while queue:
-        # Remove node with no dependencies
-        node = queue.pop(0)
-        result.append(node)
-        
-        # Update in-degrees of dependents
-        for dependent in graph.get_dependents(node):
-            in_degree[dependent] -= 1
-            if in_degree[dependent] == 0:
-                queue.append(dependent)
+    # Kahn's algorithm, starting from the nodes with no dependencies
+    result, _ = _layered_kahn(graph, graph.find_roots())
     
     # If not all nodes processed, there's a cycle (shouldn't happen after has_cycles check)
     if len(result) != len(graph.nodes):
@@ -102,28 +147,13 @@ def get_execution_order(
         if node_name not in graph.nodes:
             raise GraphError(f"Start node '{node_name}' not found in graph", node_name=node_name)
     
-    layers: List[List[str]] = []
-    remaining: Set[str] = set(graph.nodes.keys())
-    current_layer: Set[str] = set(start_nodes)
-    
-    while current_layer:
-        # Add current layer to results
-        layers.append(list(current_layer))
-        remaining -= current_layer
-        
-        # Find next layer: nodes whose dependencies are all satisfied
-        next_layer: Set[str] = set()
-        satisfied_nodes: Set[str] = set().union(*[set(layer) for layer in layers])
-        
-        for node in remaining:
-            deps = set(graph.get_dependencies(node))
-            if deps.issubset(satisfied_nodes):
-                next_layer.add(node)
-        
-        current_layer = next_layer
+    # Each layer holds the nodes whose dependencies are all in earlier layers
+    order, layers = _layered_kahn(graph, start_nodes)
     
     # If nodes remain, there might be a cycle
-    if remaining:
+    if len(order) < len(graph.nodes):
+        emitted = set(order)
+        remaining = [name for name in graph.nodes if name not in emitted]
         # Check for cycles involving remaining nodes
         cycles = graph.find_cycles()
         if cycles:
@@ -133,7 +163,7 @@ def get_execution_order(
                 cycles=cycles,
             )
         # Otherwise, disconnected components
-        layers.append(list(remaining))
+        layers.append(remaining)
     
     return layers
 
@@ -1,11 +1,76 @@
 from __future__ import annotations
-from typing import List, Optional, Annotated
+import functools
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Annotated
 import strawberry
+from strawberry.extensions import SchemaExtension
 from strawberry.scalars import JSON
 from strawberry.types import Info
 from enum import Enum
 
 from ..graph import DependencyGraph
+from ..types import NodeKind as CoreNodeKind
+
+# --- Per-request cache ---
+
+
+class GraphCache:
+    """
+    Memo of graph lookups shared by the resolvers of one GraphQL operation.
+    
+    Keys are (operation, arguments) tuples, so different lookups with equal
+    arguments never collide. Cached values are shared between resolvers and
+    must not be mutated.
+    """
+    
+    def __init__(self, maxsize: Optional[int] = None) -> None:
+        """
+        Args:
+            maxsize: Maximum number of entries to keep, or None for no limit
+        """
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Any] = {}
+    
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, computing and storing it if missing.
+        
+        Once the cache is full, new results are computed but not stored.
+        """
+        try:
+            return self._entries[key]
+        except KeyError:
+            value = compute()
+            if self.maxsize is None or len(self._entries) < self.maxsize:
+                self._entries[key] = value
+            return value
+
+
+class GraphCacheExtension(SchemaExtension):
+    """Gives each operation a fresh GraphCache at context["graph_cache"]."""
+    
+    def __init__(self, cache_size: Optional[int] = None, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.cache_size = cache_size
+    
+    def on_operation(self) -> Iterator[None]:
+        context = self.execution_context.context
+        # A cache supplied by the caller is used as is
+        owned = isinstance(context, dict) and "graph_cache" not in context
+        if owned:
+            context["graph_cache"] = GraphCache(self.cache_size)
+        try:
+            yield
+        finally:
+            if owned:
+                context.pop("graph_cache", None)
+
+
+def _cached(info: Info, key: Hashable, compute: Callable[[], Any]) -> Any:
+    """Look key up in the operation's GraphCache, if the context has one."""
+    cache: Optional[GraphCache] = info.context.get("graph_cache")
+    if cache is None:
+        return compute()
+    return cache.get(key, compute)
 
 # --- Enums ---
 
@@ -48,14 +113,22 @@ class Node:
     @strawberry.field
     def transitive_dependencies(self, info: Info) -> List[Node]:
         graph: DependencyGraph = info.context["graph"]
-        dep_names = graph.get_transitive_dependencies(self.name)
+        dep_names = _cached(
+            info,
+            ("transitive_dependencies", self.name),
+            lambda: graph.get_transitive_dependencies(self.name),
+        )
         return [node_to_graphql(graph.nodes[name]) for name in dep_names if name in graph.nodes]
 
     @strawberry.field
     def transitive_dependents(self, info: Info) -> List[Node]:
         graph: DependencyGraph = info.context["graph"]
         # This calls the reverse lookup in your DependencyGraph logic
-        dep_names = graph.get_transitive_dependents(self.name)
+        dep_names = _cached(
+            info,
+            ("transitive_dependents", self.name),
+            lambda: graph.get_transitive_dependents(self.name),
+        )
         return [node_to_graphql(graph.nodes[name]) for name in dep_names if name in graph.nodes]
 
 @strawberry.type
@@ -95,7 +168,13 @@ class Query:
         graph: DependencyGraph = info.context["graph"]
         nodes = graph.nodes.values()
         if kind:
-            nodes = [n for n in nodes if n.kind.value.lower() == kind.value.lower()]
+            core_kind = CoreNodeKind[kind.name]
+            names = _cached(
+                info,
+                ("nodes_by_kind", core_kind),
+                lambda: graph.find_nodes_by_kind(core_kind),
+            )
+            nodes = [graph.nodes[name] for name in names]
         if source:
             nodes = [n for n in nodes if n.source == source]
         return [node_to_graphql(n) for n in nodes]
@@ -130,7 +209,11 @@ class Query:
         to_node: Annotated[str, strawberry.argument(name="to")],
     ) -> Optional[Path]:
         graph: DependencyGraph = info.context["graph"]
-        path_nodes = graph.find_path(from_node, to_node)
+        path_nodes = _cached(
+            info,
+            ("path", from_node, to_node),
+            lambda: graph.find_path(from_node, to_node),
+        )
         if not path_nodes: return None
         return Path(nodes=path_nodes, length=len(path_nodes) - 1)
 
@@ -170,5 +253,17 @@ def edge_to_graphql(edge) -> Edge:
         metadata=getattr(edge, 'metadata', {}) or {},
     )
 
-def create_schema() -> strawberry.Schema:
-    return strawberry.Schema(query=Query)
+
+def create_schema(cache_size: Optional[int] = None) -> strawberry.Schema:
+    """
+    Build the GraphQL schema.
+    
+    Args:
+        cache_size: Maximum entries in each operation's GraphCache, None for
+            no limit, or 0 to disable the per-operation cache
+    """
+    extensions = []
+    if cache_size != 0:
+        # A factory, so each operation gets its own extension instance
+        extensions.append(functools.partial(GraphCacheExtension, cache_size=cache_size))
+    return strawberry.Schema(query=Query, extensions=extensions)
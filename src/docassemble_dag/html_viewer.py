@@ -5,7 +5,6 @@ Generates standalone HTML files with interactive D3.js visualizations
 that allow users to explore dependency graphs without technical knowledge.
 """
 
-import json
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Any
 
@@ -44,13 +43,14 @@ def to_html(
         >>> html = to_html(graph, Path("graph.html"), "My Interview Dependencies")
         >>> # Opens interactive viewer in browser
     """
-    # Convert graph to JSON structure
-    graph_json = graph.to_json_struct()
+    # Serialize the graph compactly (orjson when available); the data is
+    # only read by the embedded script, so indentation would just add bytes
+    graph_json = graph.to_json_bytes().decode("utf-8")
     
     # Generate HTML with embedded D3.js visualization
     html_content = _generate_html_template(
         title=title,
-        graph_json=json.dumps(graph_json, indent=2),
+        graph_json=graph_json,
         width=width,
         height=height,
     )
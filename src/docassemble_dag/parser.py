@@ -5,10 +5,16 @@ Extracts variables, questions, rules, and their dependencies from YAML.
 Supports multi-document YAML files (separated by ---).
 """
 
+import bisect
+import hashlib
 import logging
 import os
 import re
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union, cast
 
 import yaml
 
@@ -20,6 +26,31 @@ from .types import DependencyType, Edge, Node, NodeKind
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader when PyYAML was built with it; setting
+# DAG_DISABLE_CLOADER forces the pure-Python loader (e.g. for benchmarking)
+_SafeLoader: Type[yaml.SafeLoader] = (
+    yaml.SafeLoader
+    if os.environ.get('DAG_DISABLE_CLOADER')
+    else getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+)
+
+# Extraction results memoized by (YAML text digest, file path), most recent last.
+# Each entry is [nodes, edges or None]; edges are only valid for the same node names.
+_EXTRACTION_CACHE_SIZE = 128
+_extraction_cache: "OrderedDict[Tuple[bytes, Optional[str]], List[Any]]" = OrderedDict()
+_extraction_cache_lock = threading.Lock()
+
+
+def _copy_nodes(nodes: Dict[str, Node]) -> Dict[str, Node]:
+    """Copy each Node and its metadata dict, so cached nodes stay private."""
+    return {name: replace(node, metadata=dict(node.metadata)) for name, node in nodes.items()}
+
+
+def _copy_edges(edges: List[Edge]) -> List[Edge]:
+    """Copy each Edge and its metadata dict, so cached edges stay private."""
+    return [replace(edge, metadata=dict(edge.metadata)) for edge in edges]
+
+
 # Pattern to match variable references in expressions/templates
 VARIABLE_REF_PATTERN = re.compile(r'\b([a-zA-Z_][a-zA-Z0-9_]*)\b')
 
@@ -29,6 +60,19 @@ OBJECT_ATTR_PATTERN = re.compile(r'\b([a-zA-Z_][a-zA-Z0-9_]*)\.([a-zA-Z_][a-zA-Z
 # Pattern to detect Assembly Line variables (AL_ prefix)
 ASSEMBLY_LINE_PREFIX = 'AL_'
 
+# Top-level keys that are Docassemble directives or standard sections rather
+# than custom question/variable blocks
+_NON_NODE_KEYS = frozenset({
+    'questions', 'variables', 'fields', 'rules',  # Standard sections
+    'metadata', 'modules', 'module', 'include',    # Directives
+    'objects', 'imports', 'event',                 # More directives
+    'attachments', 'table', 'review',              # Display directives
+    'features', 'default role', 'role',            # Configuration
+    'sections', 'progress', 'auto terms',          # UI elements
+    'ga id', 'interview help', 'continue button label',  # More config
+    'question', 'variable', 'field', 'expression', 'code',  # Handled separately
+})
+
 
 def parse_multi_document_yaml(yaml_text: str) -> List[Dict[str, Any]]:
     """
@@ -45,8 +89,8 @@ def parse_multi_document_yaml(yaml_text: str) -> List[Dict[str, Any]]:
     documents = []
     
     try:
-        # yaml.safe_load_all() loads all documents separated by ---
-        for doc in yaml.safe_load_all(yaml_text):
+        # Load all documents separated by --- (safe loader, libyaml if available)
+        for doc in yaml.load_all(yaml_text, Loader=_SafeLoader):
             if doc is None:  # Skip empty documents
                 continue
             
@@ -110,13 +154,21 @@ class DocassembleParser:
     Enhanced with provenance tracking (file paths, line numbers) and multi-document support.
     """
     
-    def __init__(self, yaml_text: str, file_path: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        yaml_text: str,
+        file_path: Optional[str] = None,
+        parsed: Optional[Dict[str, Any]] = None,
+    ) -> None:
         """
         Initialize parser with YAML content (supports multi-document).
         
         Args:
             yaml_text: Raw YAML content as string
             file_path: Optional file path for provenance tracking
+            parsed: Optional already-parsed (and merged) YAML for yaml_text.
+                When given, the YAML is not parsed again; yaml_text is still
+                used for line number lookups.
             
         Raises:
             InvalidYAMLError: If YAML parsing or structure validation fails
@@ -130,22 +182,30 @@ class DocassembleParser:
         self.file_path = file_path
         self.yaml_text = yaml_text
         self.yaml_lines = yaml_text.split('\n') if yaml_text else []
+        self._yaml_joined = ''
+        self._line_starts: Optional[List[int]] = None
+        self._line_number_cache: Dict[str, Optional[int]] = {}
         
-        # Parse all documents separated by ---
-        try:
-            documents = parse_multi_document_yaml(yaml_text)
-        except yaml.YAMLError as e:
-            raise InvalidYAMLError(
-                f"Failed to parse YAML: {e}",
-                file_path=file_path,
-                original_error=e,
-            ) from e
-        
-        # Merge all documents into single structure
-        if documents:
-            self.raw = merge_yaml_documents(documents)
+        if parsed is not None:
+            self.raw = parsed
+            document_count = 1
         else:
-            self.raw = {}
+            # Parse all documents separated by ---
+            try:
+                documents = parse_multi_document_yaml(yaml_text)
+            except yaml.YAMLError as e:
+                raise InvalidYAMLError(
+                    f"Failed to parse YAML: {e}",
+                    file_path=file_path,
+                    original_error=e,
+                ) from e
+            document_count = len(documents)
+            
+            # Merge all documents into single structure
+            if documents:
+                self.raw = merge_yaml_documents(documents)
+            else:
+                self.raw = {}
         
         if not isinstance(self.raw, dict):
             raise InvalidYAMLError(
@@ -161,12 +221,19 @@ class DocassembleParser:
                 file_path=file_path,
             )
         
+        # Identical YAML text yields identical nodes and edges, unless the
+        # content comes from elsewhere (pre-parsed input or included files)
+        self._cache_key: Optional[Tuple[bytes, Optional[str]]] = None
+        if parsed is None and 'include' not in self.raw:
+            digest = hashlib.blake2b(yaml_text.encode('utf-8'), digest_size=16).digest()
+            self._cache_key = (digest, file_path)
+        
         # Process include directives (must happen after validation)
         self.resolve_includes()
         
         logger.debug(
             f"Initialized parser for {file_path or 'string input'} "
-            f"({len(documents)} document(s), {len(self.yaml_lines)} lines)"
+            f"({document_count} document(s), {len(self.yaml_lines)} lines)"
         )
     
     def resolve_includes(self) -> None:
@@ -219,33 +286,49 @@ class DocassembleParser:
         if not name:
             return None
         
-        # Search for the key name in the YAML
-        for i, line in enumerate(self.yaml_lines, 1):
-            if name in line and (
-                f'name: {name}' in line 
-                or f'"{name}"' in line 
-                or f"'{name}'" in line
-            ):
-                return i
-        
-        return None
+        return self._find_line_number_by_name(name)
     
     def _find_line_number_by_name(self, name: str) -> Optional[int]:
         """
         Find approximate line number for a node name in the YAML text.
+        
+        Returns the first line containing ``name: <name>`` or the quoted
+        name. Rather than scanning line by line for every node, each pattern
+        is found in the whole text with str.find and the offset mapped to a
+        line by bisecting the line start offsets; results are memoized per
+        name, since edges look up the same names as nodes.
         """
         if not self.yaml_lines or not name:
             return None
         
-        for i, line in enumerate(self.yaml_lines, 1):
-            if name in line and (
-                f'name: {name}' in line 
-                or f'"{name}"' in line 
-                or f"'{name}'" in line
-            ):
-                return i
-        
-        return None
+        if name in self._line_number_cache:
+            return self._line_number_cache[name]
+        
+        if self._line_starts is None:
+            self._yaml_joined = '\n'.join(self.yaml_lines)
+            starts = [0]
+            pos = self._yaml_joined.find('\n')
+            while pos != -1:
+                starts.append(pos + 1)
+                pos = self._yaml_joined.find('\n', pos + 1)
+            self._line_starts = starts
+        
+        line_num: Optional[int] = None
+        if '\n' not in name:  # Patterns spanning lines can never match one line
+            text = self._yaml_joined
+            first = -1
+            for pattern in (f'name: {name}', f'"{name}"', f"'{name}'"):
+                # Once one pattern is found, later ones only need to be
+                # searched for before it
+                end = len(text) if first == -1 else first + len(pattern)
+                pos = text.find(pattern, 0, end)
+                if pos != -1 and (first == -1 or pos < first):
+                    first = pos
+            if first != -1:
+                line_num = bisect.bisect_right(self._line_starts, first)
+        
+        self._line_number_cache[name] = line_num
+        return line_num
     
     def _extract_implicit_dependencies(
         self,
@@ -304,21 +387,49 @@ class DocassembleParser:
         for match in VARIABLE_REF_PATTERN.findall(text):
             ref_name = match
             # Skip if it's the node's own name (self-reference)
-            # Skip if it's an object we already processed (person.name already handled as person)
-            if (
-                ref_name != dst_name
-                and ref_name not in processed_objects
-                and not any(ref_name == obj_name for obj_name, _ in object_attrs)
-            ):
+            # Skip if it's an object we already processed (person.name already handled as person);
+            # processed_objects holds every attribute owner other than dst_name, so this
+            # set lookup replaces rescanning object_attrs for each reference
+            if ref_name != dst_name and ref_name not in processed_objects:
                 add_edge(ref_name, dst_name, DependencyType.IMPLICIT, line_num)
     
+    def _cache_entry(self) -> Optional[List[Any]]:
+        """Return this parser's extraction cache entry, marking it recently used."""
+        if self._cache_key is None:
+            return None
+        with _extraction_cache_lock:
+            entry = _extraction_cache.get(self._cache_key)
+            if entry is not None:
+                _extraction_cache.move_to_end(self._cache_key)
+            return entry
+    
     def extract_nodes(self) -> Dict[str, Node]:
         """
         Extract all nodes (variables, questions, rules) from the YAML.
         
+        Results are memoized by YAML text and file path, so parsing the same
+        interview again skips extraction. Each call returns new Node objects,
+        so callers may mutate them without affecting later parses.
+        
         Returns:
             Dictionary mapping node name to Node object
         """
+        entry = self._cache_entry()
+        if entry is not None:
+            return _copy_nodes(entry[0])
+        
+        nodes = self._extract_nodes()
+        
+        if self._cache_key is not None:
+            with _extraction_cache_lock:
+                _extraction_cache[self._cache_key] = [_copy_nodes(nodes), None]
+                if len(_extraction_cache) > _EXTRACTION_CACHE_SIZE:
+                    _extraction_cache.popitem(last=False)
+        
+        return nodes
+    
+    def _extract_nodes(self) -> Dict[str, Node]:
+        """Extract nodes from self.raw without consulting the cache."""
         nodes: Dict[str, Node] = {}
         
         # Extract variables (fields)
@@ -349,7 +460,7 @@ class DocassembleParser:
                 name=name,
                 kind=kind,
                 source=source,
-                authority=var.get('authority') or var.get('statute'),
+                authority=self._get_authority(var),
                 file_path=self.file_path,
                 line_number=line_num
             )
@@ -370,7 +481,7 @@ class DocassembleParser:
                 name=name,
                 kind=NodeKind.QUESTION,
                 source="user_input",
-                authority=q.get('authority') or q.get('statute'),
+                authority=self._get_authority(q),
                 file_path=self.file_path,
                 line_number=self._find_line_number('name', q)
             )
@@ -403,7 +514,7 @@ class DocassembleParser:
                 name=name,
                 kind=NodeKind.RULE,
                 source="derived",
-                authority=rule.get('authority') or rule.get('statute'),
+                authority=self._get_authority(rule),
                 file_path=self.file_path,
                 line_number=self._find_line_number('name', rule)
             )
@@ -446,7 +557,7 @@ class DocassembleParser:
                     name=name,
                     kind=NodeKind.QUESTION,
                     source="user_input",
-                    authority=self.raw.get('authority') or self.raw.get('statute'),
+                    authority=self._get_authority(self.raw),
                     file_path=self.file_path,
                     line_number=self._find_line_number_by_name(name)
                 )
@@ -471,28 +582,16 @@ class DocassembleParser:
                     name=name,
                     kind=NodeKind.VARIABLE,
                     source="derived",
-                    authority=self.raw.get('authority') or self.raw.get('statute'),
+                    authority=self._get_authority(self.raw),
                     file_path=self.file_path,
                     line_number=self._find_line_number_by_name(name)
                 )
         
         # Handle top-level items that might be questions or variables
         # These are custom keys like "custom_question:" or "custom_var:"
-        # Skip known Docassemble directives and standard sections
-        skip_keys = {
-            'questions', 'variables', 'fields', 'rules',  # Standard sections
-            'metadata', 'modules', 'module', 'include',    # Directives
-            'objects', 'imports', 'event',                 # More directives
-            'attachments', 'table', 'review',              # Display directives
-            'features', 'default role', 'role',            # Configuration
-            'sections', 'progress', 'auto terms',          # UI elements
-            'ga id', 'interview help', 'continue button label',  # More config
-            'question', 'variable', 'field', 'expression', 'code',  # Already handled above
-        }
-        
         for key, value in self.raw.items():
             # Skip standard sections and directives
-            if key in skip_keys:
+            if key in _NON_NODE_KEYS:
                 continue
             
             if isinstance(value, dict):
@@ -505,7 +604,7 @@ class DocassembleParser:
                             name=name,
                             kind=NodeKind.QUESTION,
                             source="user_input",
-                            authority=value.get('authority') or value.get('statute'),
+                            authority=self._get_authority(value),
                             file_path=self.file_path,
                             line_number=self._find_line_number('name', value)
                         )
@@ -531,7 +630,7 @@ class DocassembleParser:
                             name=name,
                             kind=NodeKind.VARIABLE,
                             source="derived",
-                            authority=value.get('authority') or value.get('statute'),
+                            authority=self._get_authority(value),
                             file_path=self.file_path,
                             line_number=self._find_line_number('name', value)
                         )
@@ -542,18 +641,38 @@ class DocassembleParser:
         """
         Extract dependency edges (explicit and implicit) from the YAML.
         
+        Results are memoized alongside extract_nodes() when nodes has the
+        same names as the extracted nodes (edges only depend on node names).
+        Each call returns new Edge objects.
+        
         Args:
             nodes: Dictionary of nodes to validate dependencies against
         
         Returns:
             List of Edge objects representing dependencies
         """
+        entry = self._cache_entry()
+        cacheable = entry is not None and nodes.keys() == entry[0].keys()
+        if cacheable and entry[1] is not None:
+            return _copy_edges(entry[1])
+        
+        edges = self._extract_edges(nodes)
+        
+        if cacheable:
+            entry[1] = _copy_edges(edges)
+        
+        return edges
+    
+    def _extract_edges(self, nodes: Dict[str, Node]) -> List[Edge]:
+        """Extract edges from self.raw without consulting the cache."""
         edges: List[Edge] = []
         edges_seen: Set[tuple] = set()  # Track (from, to) pairs to avoid duplicates
         
         # Helper to add edge if not duplicate
         def add_edge(from_node: str, to_node: str, dep_type: DependencyType, line_num: Optional[int] = None):
             if from_node in nodes and to_node in nodes:
+                from_node = sys.intern(from_node)
+                to_node = sys.intern(to_node)
                 edge_key = (from_node, to_node)
                 if edge_key not in edges_seen and from_node != to_node:
                     edges.append(Edge(
@@ -692,6 +811,24 @@ class DocassembleParser:
             if key in item:
                 name = item[key]
                 if isinstance(name, str):
-                    return name
+                    # Interned so the same name from nodes, edges and code
+                    # extraction is one shared string object
+                    return sys.intern(name)
         
         return None
+    
+    def _get_authority(self, item: Dict[str, Any]) -> Optional[str]:
+        """
+        Extract the legal authority (or statute) cited by an item.
+        
+        Interviews cite the same statutes on many items, so citations are
+        interned to share one string object per distinct authority.
+        
+        Returns:
+            Authority string, or None if not present
+        """
+        authority = item.get('authority') or item.get('statute')
+        if isinstance(authority, str):
+            return sys.intern(authority)
+        # Other values are passed through unchanged, as before interning
+        return cast(Optional[str], authority)
@@ -18,6 +18,14 @@ from .types import DependencyType, Edge, Node, NodeKind
 
 logger = logging.getLogger(__name__)
 
+# Column order for the row tuples written by GraphStorage.save_graph
+_NODE_COLUMNS = (
+    "graph_id", "name", "kind", "source", "authority", "file_path", "line_number", "metadata",
+)
+_EDGE_COLUMNS = (
+    "graph_id", "from_node", "to_node", "dep_type", "file_path", "line_number", "metadata",
+)
+
 
 class GraphStorage:
     """
@@ -167,13 +175,12 @@ class GraphStorage:
                 )
                 graph_id = cursor.lastrowid
                 
-                # Insert nodes
-                for node in graph.nodes.values():
-                    node_metadata_json = json.dumps(node.metadata) if node.metadata else None
-                    cursor.execute(
-                        f"""INSERT INTO nodes 
-                           (graph_id, name, kind, source, authority, file_path, line_number, metadata)
-                           VALUES ({placeholder}, {placeholder}, {placeholder}, {placeholder}, {placeholder}, {placeholder}, {placeholder}, {placeholder})""",
+                # Insert nodes and edges in one batched call each
+                self.backend.insert_rows(
+                    cursor,
+                    "nodes",
+                    _NODE_COLUMNS,
+                    (
                         (
                             graph_id,
                             node.name,
@@ -182,17 +189,16 @@ class GraphStorage:
                             node.authority,
                             node.file_path,
                             node.line_number,
-                            node_metadata_json,
+                            json.dumps(node.metadata) if node.metadata else None,
                         )
-                    )
-                
-                # Insert edges
-                for edge in graph.edges:
-                    edge_metadata_json = json.dumps(edge.metadata) if edge.metadata else None
-                    cursor.execute(
-                        f"""INSERT INTO edges
-                           (graph_id, from_node, to_node, dep_type, file_path, line_number, metadata)
-                           VALUES ({placeholder}, {placeholder}, {placeholder}, {placeholder}, {placeholder}, {placeholder}, {placeholder})""",
+                        for node in graph.nodes.values()
+                    ),
+                )
+                self.backend.insert_rows(
+                    cursor,
+                    "edges",
+                    _EDGE_COLUMNS,
+                    (
                         (
                             graph_id,
                             edge.from_node,
@@ -200,9 +206,11 @@ class GraphStorage:
                             edge.dep_type.value,
                             edge.file_path,
                             edge.line_number,
-                            edge_metadata_json,
+                            json.dumps(edge.metadata) if edge.metadata else None,
                         )
-                    )
+                        for edge in graph.edges
+                    ),
+                )
                 
                 # Transaction commits automatically via context manager
                 logger.info(f"Saved graph '{name}' with {len(graph.nodes)} nodes and {len(graph.edges)} edges")
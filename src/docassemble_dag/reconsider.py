@@ -7,12 +7,23 @@ and warns when dependencies cross reconsider boundaries.
 """
 
 import logging
-from typing import Dict, List, Optional, Set
+import sys
+from typing import Dict, FrozenSet, Iterable, List, Optional, Union
 
 from .graph import DependencyGraph
 
 logger = logging.getLogger(__name__)
 
+# Sections whose items may carry a reconsider directive
+_ITEM_SECTIONS = ('questions', 'rules', 'variables', 'fields')
+
+# Marks an absent key, so present-but-falsy values are not confused with it
+_MISSING = object()
+
+# Constant fields of reconsider boundary warnings
+_WARNING_TYPE = "reconsider_boundary"
+_WARNING_TEXT = "Variable is reconsidered, which may break static dependency assumptions"
+
 
 class ReconsiderDirective:
     """
@@ -38,8 +49,12 @@ class ReconsiderDirective:
             line_number: Optional line number
             file_path: Optional file path
         """
-        self.node_name = node_name
-        self.reconsidered_var = reconsidered_var
+        # Interned: these names are used as set members and compared against
+        # graph node names on every boundary check
+        self.node_name = sys.intern(node_name) if isinstance(node_name, str) else node_name
+        self.reconsidered_var = (
+            sys.intern(reconsidered_var) if isinstance(reconsidered_var, str) else reconsidered_var
+        )
         self.line_number = line_number
         self.file_path = file_path
 
@@ -56,8 +71,12 @@ def extract_reconsider_directives(yaml_dict: Dict) -> List[ReconsiderDirective]:
     """
     directives: List[ReconsiderDirective] = []
     
+    # Nothing to scan if none of the item sections are present
+    if not any(item_type in yaml_dict for item_type in _ITEM_SECTIONS):
+        return directives
+    
     # Check all item types for reconsider directives
-    for item_type in ['questions', 'rules', 'variables', 'fields']:
+    for item_type in _ITEM_SECTIONS:
         items = yaml_dict.get(item_type, [])
         if not isinstance(items, list):
             items = []
@@ -66,12 +85,17 @@ def extract_reconsider_directives(yaml_dict: Dict) -> List[ReconsiderDirective]:
             if not isinstance(item, dict):
                 continue
             
+            # Check for reconsider directive first; most items have none
+            reconsider_val = item.get('reconsider', _MISSING)
+            if reconsider_val is _MISSING:
+                reconsider_val = item.get('reconsider:', _MISSING)
+                if reconsider_val is _MISSING:
+                    continue
+            
             node_name = item.get('name') or item.get('variable')
             if not node_name:
                 continue
             
-            # Check for reconsider directive
-            reconsider_val = item.get('reconsider') or item.get('reconsider:')
             if reconsider_val:
                 # reconsider can be a single variable or a list
                 reconsidered_vars = reconsider_val if isinstance(reconsider_val, list) else [reconsider_val]
@@ -89,7 +113,7 @@ def extract_reconsider_directives(yaml_dict: Dict) -> List[ReconsiderDirective]:
 
 def check_reconsider_boundaries(
     graph: DependencyGraph,
-    reconsider_directives: List[ReconsiderDirective],
+    reconsider_directives: Union[List[ReconsiderDirective], FrozenSet[str]],
 ) -> List[Dict]:
     """
     Check if dependencies cross reconsider boundaries.
@@ -99,35 +123,47 @@ def check_reconsider_boundaries(
     
     Args:
         graph: Dependency graph to check
-        reconsider_directives: List of reconsider directives
+        reconsider_directives: List of reconsider directives, or a frozenset of
+            reconsidered variable names (as returned by get_reconsidered_variables)
+            to avoid rebuilding it on repeated checks
         
     Returns:
         List of warning dictionaries
     """
+    # Most interviews have no reconsider directives; skip the edge scan
+    if not reconsider_directives:
+        return []
+    
     warnings: List[Dict] = []
     
-    # Build map of reconsidered variables
-    reconsidered_vars: Set[str] = {d.reconsidered_var for d in reconsider_directives}
+    # Build ordered reconsidered variables: directive order, or sorted for a frozenset
+    if isinstance(reconsider_directives, frozenset):
+        reconsidered_vars: Iterable[str] = sorted(reconsider_directives)
+    else:
+        reconsidered_vars = dict.fromkeys(d.reconsidered_var for d in reconsider_directives)
     
-    # Check each edge for crossing reconsider boundaries
-    for edge in graph.edges:
-        from_var = edge.from_node
-        to_var = edge.to_node
-        
-        # If from_var is reconsidered, warn about dependency crossing
-        if from_var in reconsidered_vars:
-            warnings.append({
-                "type": "reconsider_boundary",
-                "message": f"Dependency from '{from_var}' to '{to_var}' crosses reconsider boundary",
-                "from_node": from_var,
-                "to_node": to_var,
-                "warning": "Variable is reconsidered, which may break static dependency assumptions",
-            })
+    # Only the outgoing edges of reconsidered variables can cross a boundary,
+    # so walk those via the adjacency list instead of scanning every edge
+    adj = graph.adj
+    for from_var in reconsidered_vars:
+        for to_var in adj.get(from_var, ()):
+            warnings.append(_boundary_warning(from_var, to_var))
     
     return warnings
 
 
-def get_reconsidered_variables(reconsider_directives: List[ReconsiderDirective]) -> Set[str]:
+def _boundary_warning(from_var: str, to_var: str) -> Dict:
+    """Build the warning dictionary for an edge crossing a reconsider boundary."""
+    return {
+        "type": _WARNING_TYPE,
+        "message": f"Dependency from '{from_var}' to '{to_var}' crosses reconsider boundary",
+        "from_node": from_var,
+        "to_node": to_var,
+        "warning": _WARNING_TEXT,
+    }
+
+
+def get_reconsidered_variables(reconsider_directives: List[ReconsiderDirective]) -> FrozenSet[str]:
     """
     Get set of all variables that are reconsidered.
     
@@ -135,6 +171,7 @@ def get_reconsidered_variables(reconsider_directives: List[ReconsiderDirective])
         reconsider_directives: List of reconsider directives
         
     Returns:
-        Set of variable names that are reconsidered
+        Frozenset of variable names that are reconsidered; can be passed back
+        to check_reconsider_boundaries for repeated checks
     """
-    return {d.reconsidered_var for d in reconsider_directives}
+    return frozenset(d.reconsidered_var for d in reconsider_directives)
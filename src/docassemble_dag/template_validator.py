@@ -19,6 +19,8 @@ MAKO_VAR_PATTERN = re.compile(r'\$\{([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z0-9_]+)?)
 # Pattern to match Docassemble template variables {variable} or {object.attribute}
 # Supports nested attributes like {client.name.first}
 TEMPLATE_VAR_PATTERN = re.compile(r'\{([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z0-9_]+)*)\}')
+# Pattern to match XML tags, stripped from raw DOCX document.xml
+XML_TAG_PATTERN = re.compile(r'<[^>]+>')
 
 
 class TemplateValidationResult:
@@ -116,7 +118,7 @@ def _extract_docx_variables(template_path: Path) -> Tuple[Set[str], Set[str]]:
                 if 'word/document.xml' in zip_file.namelist():
                     xml_content = zip_file.read('word/document.xml').decode('utf-8', errors='ignore')
                     # Extract text between <w:t> tags
-                    text = re.sub(r'<[^>]+>', ' ', xml_content)
+                    text = XML_TAG_PATTERN.sub(' ', xml_content)
                 else:
                     text = ""
         
@@ -4,9 +4,30 @@ Core data types for representing the dependency graph.
 These types are framework-agnostic and represent the core domain model.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Type, TypeVar, cast
+
+_T = TypeVar("_T")
+
+
+def _with_slots(cls: Type[_T]) -> Type[_T]:
+    """
+    Rebuild a dataclass with __slots__ for its fields.
+    
+    Equivalent to ``@dataclass(slots=True)``, which needs Python 3.10+.
+    Drops the per-instance __dict__, which matters for large graphs.
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cast(Any, cls)))
+    cls_dict["__slots__"] = field_names
+    # Field defaults live in the generated __init__, not on the class
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    metaclass: Any = type(cls)
+    return cast(Type[_T], metaclass(cls.__name__, cls.__bases__, cls_dict))
 
 
 class NodeKind(Enum):
@@ -23,6 +44,7 @@ class DependencyType(Enum):
     IMPLICIT = "implicit"  # variable referenced in expression, template, etc.
 
 
+@_with_slots
 @dataclass
 class Node:
     """
@@ -41,6 +63,7 @@ class Node:
     metadata: Dict[str, Any] = field(default_factory=dict)  # Additional metadata
 
 
+@_with_slots
 @dataclass
 class Edge:
     """
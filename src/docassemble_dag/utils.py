@@ -2,19 +2,55 @@
 Utility functions for batch processing, graph merging, and multi-file support.
 """
 
+import functools
 import logging
+import os
+import re
+import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Set, Optional, Tuple
 
 import yaml
 
+from .exceptions import DocassembleDAGError
 from .graph import DependencyGraph
-from .parser import DocassembleParser
+from .parser import (
+    DocassembleParser,
+    _SafeLoader,
+    _copy_edges,
+    _copy_nodes,
+    merge_yaml_documents,
+    parse_multi_document_yaml,
+)
 from .types import DependencyType, Edge, Node, NodeKind
 
 logger = logging.getLogger(__name__)
 
+# File suffixes treated as Docassemble interview YAML
+_YAML_SUFFIXES = ('.yaml', '.yml')
+
+
+def _scandir_yaml(path: str, recursive: bool = True) -> Iterator[Path]:
+    """
+    Yield YAML files under a directory in a single scandir pass.
+    
+    Uses the cached DirEntry type flags so no extra stat() calls are made.
+    Directory symlinks are not followed; unreadable or vanished directories
+    are skipped.
+    """
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        yield from _scandir_yaml(entry.path, recursive)
+                elif entry.is_file() and entry.name.endswith(_YAML_SUFFIXES):
+                    yield Path(entry.path)
+    except (PermissionError, FileNotFoundError):
+        pass
+
 
 def find_yaml_files(path: Path, recursive: bool = True) -> List[Path]:
     """
@@ -30,20 +66,14 @@ def find_yaml_files(path: Path, recursive: bool = True) -> List[Path]:
     path = Path(path)
     
     if path.is_file():
-        if path.suffix in ('.yaml', '.yml'):
+        if path.suffix in _YAML_SUFFIXES:
             return [path]
         return []
     
     if not path.is_dir():
         return []
     
-    yaml_files = []
-    if recursive:
-        yaml_files = list(path.rglob('*.yaml')) + list(path.rglob('*.yml'))
-    else:
-        yaml_files = list(path.glob('*.yaml')) + list(path.glob('*.yml'))
-    
-    return sorted(yaml_files)
+    return sorted(_scandir_yaml(str(path), recursive))
 
 
 def merge_graphs(graphs: List[DependencyGraph]) -> DependencyGraph:
@@ -60,59 +90,119 @@ def merge_graphs(graphs: List[DependencyGraph]) -> DependencyGraph:
         Merged DependencyGraph
     """
     merged_nodes: Dict[str, Node] = {}
-    merged_edges: List[Edge] = []
-    edges_seen: Set[Tuple[str, str]] = set()
+    edges_by_key: Dict[Tuple[str, str], Edge] = {}
     
     for graph in graphs:
-        # Merge nodes (first occurrence wins for conflicts)
-        for name, node in graph.nodes.items():
-            if name not in merged_nodes:
-                merged_nodes[name] = node
-        
-        # Merge edges (avoid duplicates)
-        for edge in graph.edges:
-            edge_key = (edge.from_node, edge.to_node)
-            if edge_key not in edges_seen:
-                merged_edges.append(edge)
-                edges_seen.add(edge_key)
+        if graph.nodes or graph.edges:
+            _merge_into(merged_nodes, edges_by_key, graph.nodes, graph.edges)
+    
+    # Every edge came from a validated graph whose nodes were all merged in
+    return DependencyGraph.from_trusted(merged_nodes, list(edges_by_key.values()))
+
+
+def _merge_into(
+    merged_nodes: Dict[str, Node],
+    edges_by_key: Dict[Tuple[str, str], Edge],
+    nodes: Dict[str, Node],
+    edges: List[Edge],
+) -> None:
+    """
+    Merge one graph's nodes and edges into the accumulators.
+    
+    Nodes with the same name keep the first occurrence. Edges are keyed by
+    (from_node, to_node); dicts keep insertion order, so the first occurrence
+    of each edge wins and edge order is preserved. A plain tuple key reuses
+    the strings' cached hashes and measured faster than either
+    concatenated-string or integer-id keys.
     
-    return DependencyGraph(merged_nodes, merged_edges)
+    Names are interned so the same name from many files shares one string
+    and later lookups can compare by identity.
+    """
+    for name, node in nodes.items():
+        if name not in merged_nodes:
+            merged_nodes[sys.intern(name)] = node
+    
+    for edge in edges:
+        edges_by_key.setdefault((sys.intern(edge.from_node), sys.intern(edge.to_node)), edge)
 
 
-def parse_multiple_files(file_paths: List[Path]) -> DependencyGraph:
+def _parse_one(file_path: Path) -> Optional[Tuple[Dict[str, Node], List[Edge]]]:
+    """
+    Parse a single YAML file for parse_multiple_files.
+    
+    Returns:
+        Tuple of (nodes, edges), or None if the file could not be parsed
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            yaml_text = f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        logger.warning(
+            "Failed to read %s: %s. "
+            "This file will be skipped. Check the file path and permissions and try again.",
+            file_path, e,
+        )
+        return None
+    
+    try:
+        parser = DocassembleParser(yaml_text, file_path=str(file_path))
+        nodes = parser.extract_nodes()
+        edges = parser.extract_edges(nodes)
+    except (DocassembleDAGError, yaml.YAMLError, TypeError, ValueError, AttributeError) as e:
+        # YAML that loads but has an unexpected shape surfaces as a
+        # TypeError/ValueError/AttributeError from the parser
+        logger.warning(
+            "Failed to parse %s: %s. "
+            "This file will be skipped. Check YAML syntax and try again.",
+            file_path, e,
+        )
+        return None
+    
+    logger.debug("Successfully parsed %s: %d nodes, %d edges", file_path, len(nodes), len(edges))
+    return nodes, edges
+
+
+def parse_multiple_files(file_paths: List[Path], workers: int = 0) -> DependencyGraph:
     """
     Parse multiple YAML files and merge into a single dependency graph.
     
     Args:
         file_paths: List of YAML file paths
+        workers: Number of threads used to read and parse files. 0 (the
+            default) parses serially. Results are always merged in
+            file_paths order, so the output does not depend on this value.
         
     Returns:
         Merged DependencyGraph
     """
-    graphs = []
+    # A single file needs no merging: the parser already dedupes its edges
+    if len(file_paths) == 1:
+        result = _parse_one(file_paths[0])
+        if result is None:
+            return DependencyGraph({}, [])
+        return DependencyGraph(*result)
     
-    for file_path in file_paths:
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                yaml_text = f.read()
-            
-            parser = DocassembleParser(yaml_text, file_path=str(file_path))
-            nodes = parser.extract_nodes()
-            edges = parser.extract_edges(nodes)
-            graph = DependencyGraph(nodes, edges)
-            graphs.append(graph)
-            logger.debug(f"Successfully parsed {file_path}: {len(nodes)} nodes, {len(edges)} edges")
-        except Exception as e:
-            logger.warning(
-                f"Failed to parse {file_path}: {e}. "
-                "This file will be skipped. Check YAML syntax and try again."
-            )
-            continue
+    merged_nodes: Dict[str, Node] = {}
+    edges_by_key: Dict[Tuple[str, str], Edge] = {}
     
-    if not graphs:
-        return DependencyGraph({}, [])
+    if workers > 0 and len(file_paths) > 1:
+        executor = ThreadPoolExecutor(max_workers=min(workers, len(file_paths)))
+        results: Iterable = executor.map(_parse_one, file_paths)
+    else:
+        executor = None
+        results = map(_parse_one, file_paths)
     
-    return merge_graphs(graphs)
+    try:
+        for result in results:
+            if result is None:
+                continue
+            nodes, edges = result
+            _merge_into(merged_nodes, edges_by_key, nodes, edges)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    
+    return DependencyGraph(merged_nodes, list(edges_by_key.values()))
 
 
 def find_nodes_by_authority(graph: DependencyGraph, authority_pattern: str) -> List[Node]:
@@ -126,14 +216,35 @@ def find_nodes_by_authority(graph: DependencyGraph, authority_pattern: str) -> L
     Returns:
         List of Node objects matching the pattern
     """
-    pattern_lower = authority_pattern.lower()
-    matching_nodes = []
+    pattern_cf = authority_pattern.casefold()
+    return [
+        node for authority_cf, node in graph.get_authority_index()
+        if pattern_cf in authority_cf
+    ]
+
+
+def find_nodes_by_authorities(graph: DependencyGraph, authority_patterns: List[str]) -> List[Node]:
+    """
+    Find all nodes whose authority matches any of several patterns.
+    
+    Equivalent to combining find_nodes_by_authority over each pattern, but
+    scans every authority once with a single compiled alternation.
     
-    for node in graph.nodes.values():
-        if node.authority and pattern_lower in node.authority.lower():
-            matching_nodes.append(node)
+    Args:
+        graph: DependencyGraph to search
+        authority_patterns: Patterns to match (substring match, case-insensitive)
+        
+    Returns:
+        List of Node objects matching at least one pattern, in node order
+    """
+    if not authority_patterns:
+        return []
     
-    return matching_nodes
+    search = re.compile('|'.join(re.escape(p.casefold()) for p in authority_patterns)).search
+    return [
+        node for authority_cf, node in graph.get_authority_index()
+        if search(authority_cf)
+    ]
 
 
 def parse_include_directives(yaml_text: str, base_path: Optional[Path] = None) -> List[str]:
@@ -147,51 +258,74 @@ def parse_include_directives(yaml_text: str, base_path: Optional[Path] = None) -
     Returns:
         List of file paths referenced in include directives
     """
+    return _resolve_includes(_raw_include_directives(yaml_text), base_path)
+
+
+@functools.lru_cache(maxsize=256)
+def _raw_include_directives(yaml_text: str) -> Tuple[str, ...]:
+    """
+    Cached YAML parse behind parse_include_directives.
+    
+    Returns the unresolved entries as a tuple so cache entries stay
+    immutable; resolving them touches the filesystem and is done per call.
+    """
     try:
-        data = yaml.safe_load(yaml_text)
-        if not isinstance(data, dict):
-            return []
-        
-        includes = []
-        
-        # Check top-level 'include:' key
-        include_val = data.get('include', [])
-        if isinstance(include_val, list):
-            includes.extend(include_val)
-        elif isinstance(include_val, str):
-            includes.append(include_val)
-        
-        # Check 'modules:' key (Docassemble alternative to include)
-        modules_val = data.get('modules', [])
-        if isinstance(modules_val, list):
-            includes.extend(modules_val)
-        elif isinstance(modules_val, str):
-            includes.append(modules_val)
-        
-        # Resolve relative paths if base_path provided
-        if base_path:
-            resolved = []
-            for inc in includes:
-                if isinstance(inc, str):
-                    # Try relative to base_path directory
-                    if base_path.is_file():
-                        base_dir = base_path.parent
-                    else:
-                        base_dir = base_path
-                    
-                    resolved_path = (base_dir / inc).resolve()
-                    if resolved_path.exists():
-                        resolved.append(str(resolved_path))
-                    else:
-                        # Keep original if not found (might be module name)
-                        resolved.append(inc)
-                else:
-                    resolved.append(inc)
-            includes = resolved
-        
-        return [str(inc) for inc in includes if isinstance(inc, str)]
+        data = yaml.load(yaml_text, Loader=_SafeLoader)
     except Exception:
+        return ()
+    return tuple(_include_entries(data))
+
+
+def _include_entries(data: Any) -> List[str]:
+    """
+    Collect 'include:' and 'modules:' entries from already-parsed YAML.
+    
+    Shared by parse_include_directives and the parse_with_includes hot path.
+    """
+    if not isinstance(data, dict):
         return []
+    
+    includes = []
+    
+    # Check top-level 'include:' key
+    include_val = data.get('include', [])
+    if isinstance(include_val, list):
+        includes.extend(include_val)
+    elif isinstance(include_val, str):
+        includes.append(include_val)
+    
+    # Check 'modules:' key (Docassemble alternative to include)
+    modules_val = data.get('modules', [])
+    if isinstance(modules_val, list):
+        includes.extend(modules_val)
+    elif isinstance(modules_val, str):
+        includes.append(modules_val)
+    
+    return [inc for inc in includes if isinstance(inc, str)]
+
+
+def _resolve_includes(includes: Iterable[str], base_path: Optional[Path] = None) -> List[str]:
+    """
+    Resolve include entries relative to base_path against the filesystem.
+    
+    Entries whose file does not exist (for example module names) are kept
+    as written. Without a base_path the entries are returned unchanged.
+    """
+    if not base_path:
+        return list(includes)
+    
+    # Try relative to base_path directory
+    base_path = Path(base_path)
+    base_dir = base_path.parent if base_path.is_file() else base_path
+    resolved = []
+    for inc in includes:
+        resolved_path = (base_dir / inc).resolve()
+        if resolved_path.exists():
+            resolved.append(str(resolved_path))
+        else:
+            # Keep original if not found (might be module name)
+            resolved.append(inc)
+    return resolved
 
 
 def parse_with_includes(file_path: Path, visited: Optional[Set[str]] = None) -> Tuple[DependencyGraph, Set[str]]:
@@ -208,46 +342,89 @@ def parse_with_includes(file_path: Path, visited: Optional[Set[str]] = None) ->
     if visited is None:
         visited = set()
     
-    file_path = Path(file_path).resolve()
+    # Every file merges straight into these, in depth-first order, so the
+    # graph is built once instead of re-merging the growing result per include
+    merged_nodes: Dict[str, Node] = {}
+    edges_by_key: Dict[Tuple[str, str], Edge] = {}
+    _collect_with_includes(Path(file_path), visited, merged_nodes, edges_by_key)
+    
+    return DependencyGraph(merged_nodes, list(edges_by_key.values())), visited
+
+
+def _collect_with_includes(
+    file_path: Path,
+    visited: Set[str],
+    merged_nodes: Dict[str, Node],
+    edges_by_key: Dict[Tuple[str, str], Edge],
+) -> None:
+    """
+    Merge file_path and its includes (depth-first) into the given accumulators.
+    
+    Uses merge_graphs semantics: first node wins, edges are deduplicated on
+    (from_node, to_node). Files already in visited are skipped, which also
+    prevents include cycles.
+    """
+    file_path = file_path.resolve()
     file_str = str(file_path)
     
     # Prevent infinite recursion
     if file_str in visited:
-        return DependencyGraph({}, []), visited
+        return
     
     visited.add(file_str)
     
     # Parse main file
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            yaml_text = f.read()
-    except FileNotFoundError as e:
+        includes, nodes, edges = _load_and_parse(file_str, os.stat(file_str).st_mtime_ns)
+    except FileNotFoundError:
         logger.warning(
-            f"File not found: {file_path}. "
-            "This file will be skipped. Check the file path and try again."
+            "File not found: %s. "
+            "This file will be skipped. Check the file path and try again.",
+            file_path,
         )
-        return DependencyGraph({}, []), visited
-    except Exception as e:
+        return
+    except (OSError, UnicodeDecodeError) as e:
         logger.warning(
-            f"Failed to read {file_path}: {e}. "
-            "This file will be skipped. Check file permissions and try again."
+            "Failed to read %s: %s. "
+            "This file will be skipped. Check file permissions and try again.",
+            file_path, e,
         )
-        return DependencyGraph({}, []), visited
+        return
     
-    # Find includes
-    include_paths = parse_include_directives(yaml_text, base_path=file_path)
+    # Cached results are shared, so callers get their own Node/Edge objects
+    _merge_into(merged_nodes, edges_by_key, _copy_nodes(nodes), _copy_edges(edges))
     
-    # Parse main file
-    parser = DocassembleParser(yaml_text, file_path=file_str)
-    nodes = parser.extract_nodes()
-    edges = parser.extract_edges(nodes)
-    graph = DependencyGraph(nodes, edges)
-    
-    # Recursively parse included files
-    for include_path in include_paths:
+    # Includes are resolved per call: an included file may appear or vanish
+    # without the including file changing
+    for include_path in _resolve_includes(includes, file_path):
         include_file = Path(include_path)
         if include_file.exists():
-            include_graph, visited = parse_with_includes(include_file, visited)
-            graph = merge_graphs([graph, include_graph])
+            _collect_with_includes(include_file, visited, merged_nodes, edges_by_key)
+
+
+@functools.lru_cache(maxsize=256)
+def _load_and_parse(
+    file_str: str,
+    mtime_ns: int,
+) -> Tuple[Tuple[str, ...], Dict[str, Node], List[Edge]]:
+    """
+    Read and parse a single file once, returning its includes, nodes and edges.
+    
+    Memoized on the resolved path and modification time so shared includes
+    are only read and parsed once, while edited files are picked up again.
+    The includes are unresolved, and the nodes and edges are shared with the
+    cache, so callers resolve and copy them.
+    """
+    with open(file_str, 'r', encoding='utf-8') as f:
+        yaml_text = f.read()
+    
+    # Parse the YAML once and reuse it for both include discovery and extraction
+    documents = parse_multi_document_yaml(yaml_text)
+    parsed = merge_yaml_documents(documents) if documents else {}
+    includes = _include_entries(parsed)
+    
+    parser = DocassembleParser(yaml_text, file_path=file_str, parsed=parsed)
+    nodes = parser.extract_nodes()
+    edges = parser.extract_edges(nodes)
     
-    return graph, visited
+    return tuple(includes), nodes, edges
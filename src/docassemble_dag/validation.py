@@ -7,10 +7,10 @@ policy rules to validate dependency graphs and detect issues.
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional
 
 from .graph import DependencyGraph
-from .types import NodeKind
+from .types import Edge, NodeKind
 
 
 class PolicySeverity(Enum):
@@ -58,6 +58,9 @@ class GraphValidator:
     with provenance tracking for violations.
     """
     
+    # Rules whose errors make an interview unsafe to run
+    CRITICAL_RULES = frozenset({"no_cycles", "no_undefined_references"})
+    
     def __init__(self, graph: DependencyGraph) -> None:
         """
         Initialize validator with a dependency graph.
@@ -75,6 +78,8 @@ class GraphValidator:
             )
         self.graph = graph
         self.violations: List[PolicyViolation] = []
+        self._dangling_edges: Optional[List[Edge]] = None
+        self._validating = False
     
     def validate_all(self, policies: Optional[List[str]] = None) -> List[PolicyViolation]:
         """
@@ -100,9 +105,17 @@ class GraphValidator:
         # Run selected policies
         policies_to_run = policies if policies else list(all_policies.keys())
         
-        for policy_name in policies_to_run:
-            if policy_name in all_policies:
-                all_policies[policy_name]()
+        # The dangling-edge scan is shared by the policies of this run only,
+        # so direct check_* calls after a graph edit never see stale results
+        self._dangling_edges = None
+        self._validating = True
+        try:
+            for policy_name in policies_to_run:
+                if policy_name in all_policies:
+                    all_policies[policy_name]()
+        finally:
+            self._validating = False
+            self._dangling_edges = None
         
         return self.violations
     
@@ -145,6 +158,26 @@ class GraphValidator:
                     }
                 ))
     
+    def _find_dangling_edges(self) -> List[Edge]:
+        """
+        Return edges with an endpoint missing from the graph's nodes.
+        
+        Computed in one pass over the edges per validation run and shared
+        by the policies that look for missing nodes, which then only visit
+        the (usually empty) result. Outside validate_all() every call scans
+        the edges afresh.
+        """
+        if self._dangling_edges is not None:
+            return self._dangling_edges
+        nodes = self.graph.nodes
+        dangling = [
+            edge for edge in self.graph.edges
+            if edge.from_node not in nodes or edge.to_node not in nodes
+        ]
+        if self._validating:
+            self._dangling_edges = dangling
+        return dangling
+    
     def check_missing_dependencies(self) -> None:
         """
         Policy: All referenced dependencies must exist as nodes.
@@ -152,9 +185,9 @@ class GraphValidator:
         Detects edges that reference nodes that don't exist in the graph.
         This can happen if a variable is referenced but never defined.
         """
-        node_names = set(self.graph.nodes.keys())
+        node_names = self.graph.nodes
         
-        for edge in self.graph.edges:
+        for edge in self._find_dangling_edges():
             if edge.from_node not in node_names:
                 self.violations.append(PolicyViolation(
                     rule_name="no_missing_dependencies",
@@ -195,16 +228,9 @@ class GraphValidator:
         
         Nodes that are never referenced may indicate dead code.
         """
-        used_nodes: Set[str] = set()
-        
-        # Collect all nodes that are referenced in edges
-        for edge in self.graph.edges:
-            used_nodes.add(edge.from_node)
-            used_nodes.add(edge.to_node)
-        
-        # Check for unused nodes
-        all_nodes = set(self.graph.nodes.keys())
-        unused = all_nodes - used_nodes
+        # Nodes that no edge references are exactly the graph's orphans
+        # (cached on the graph and kept current by add_edge/remove_edge)
+        unused = set(self.graph.find_orphans())
         
         # Filter out roots (entry points are allowed to have no dependencies)
         roots = set(self.graph.find_roots())
@@ -234,9 +260,9 @@ class GraphValidator:
         """
         # This is similar to check_missing_dependencies but focuses on
         # implicit dependencies which are more likely to be errors
-        node_names = set(self.graph.nodes.keys())
+        node_names = self.graph.nodes
         
-        for edge in self.graph.edges:
+        for edge in self._find_dangling_edges():
             if edge.dep_type.value == "implicit" and edge.from_node not in node_names:
                 node = self.graph.nodes.get(edge.to_node)
                 self.violations.append(PolicyViolation(
@@ -270,6 +296,20 @@ class GraphValidator:
         }
         return summary
     
+    def get_critical_violations(self) -> List[PolicyViolation]:
+        """
+        Get error-level violations of the critical rules from the last run.
+        
+        Returns:
+            Violations whose rule is in CRITICAL_RULES with ERROR severity
+        """
+        critical_rules = self.CRITICAL_RULES
+        error = PolicySeverity.ERROR
+        return [
+            v for v in self.violations
+            if v.severity is error and v.rule_name in critical_rules
+        ]
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert validation results to dictionary for JSON serialization.
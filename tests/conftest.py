@@ -0,0 +1,25 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+from docassemble_dag.graph import DependencyGraph
+from docassemble_dag.types import Node, NodeKind, Edge, DependencyType
+
+
+@pytest.fixture(scope="session")
+def chain_graph_1000():
+    """
+    A 1000-node chain graph (node_0 -> node_1 -> ... -> node_999).
+    
+    Built once per session; tests using it must not mutate the graph.
+    """
+    nodes = {
+        f"node_{i}": Node(f"node_{i}", NodeKind.VARIABLE, "derived")
+        for i in range(1000)
+    }
+    edges = [
+        Edge(f"node_{i}", f"node_{i+1}", DependencyType.IMPLICIT)
+        for i in range(999)
+    ]
+    return DependencyGraph(nodes, edges)
@@ -3,6 +3,7 @@ Tests for AST-based Python code parsing.
 """
 
 import pytest
+from unittest.mock import patch
 from docassemble_dag.ast_parser import (
     extract_variables_from_python_ast,
     should_use_ast_parsing,
@@ -80,6 +81,18 @@ else:
         assert isinstance(objects, set)
         assert isinstance(attributes, set)
     
+    def test_repeated_code_is_memoized(self):
+        """Test that repeated code blocks reuse the cached parse."""
+        code = "total = income_a + income_b\nratio = total / household_size"
+        first = extract_variables_from_python_ast(code)
+        
+        with patch.object(ast, "parse", side_effect=AssertionError("reparsed")):
+            second = extract_variables_from_python_ast(code)
+        
+        assert second == first
+        second[0].add("mutated")
+        assert "mutated" not in extract_variables_from_python_ast(code)[0]
+    
     def test_should_use_ast_for_code_blocks(self):
         """Test detection of code blocks that should use AST."""
         # Code with Python keywords
@@ -2,9 +2,13 @@
 Tests for compliance report generation.
 """
 
+import sys
+
 import pytest
 from pathlib import Path
 from tempfile import NamedTemporaryFile
+from unittest.mock import patch
+from docassemble_dag.comparison import compare_graphs
 from docassemble_dag.compliance import ComplianceReport, generate_compliance_report
 from docassemble_dag.graph import DependencyGraph
 from docassemble_dag.types import Node, NodeKind
@@ -32,6 +36,37 @@ class TestComplianceReport:
         # The full string "CPLR 2211, 308" should also be in mapping
         assert "z" in report.authority_mapping.get("CPLR 2211, 308", []) or "z" in report.authority_mapping.get("308", [])
     
+    def test_authority_mapping_shared_citations(self):
+        """Test that nodes sharing an authority string map to each citation."""
+        nodes = {
+            "a": Node("a", NodeKind.RULE, "derived", authority="CPLR 2211 ,  CPLR 308"),
+            "b": Node("b", NodeKind.RULE, "derived", authority="CPLR 2211 ,  CPLR 308"),
+            "c": Node("c", NodeKind.RULE, "derived"),
+        }
+        graph = DependencyGraph(nodes, [])
+        
+        report = ComplianceReport(graph, "test_interview")
+        
+        assert dict(report.authority_mapping) == {
+            "CPLR 2211": ["a", "b"],
+            "CPLR 308": ["a", "b"],
+        }
+        assert report.missing_authorities == ["c"]
+    
+    def test_authority_citations_are_interned(self):
+        """Test that a citation shared by different authority strings is one key object."""
+        first = "".join(["CPLR ", "2211, CPLR 308"])
+        second = "".join(["CPLR 308, ", "CPLR 2211"])
+        nodes = {
+            "a": Node("a", NodeKind.RULE, "derived", authority=first),
+            "b": Node("b", NodeKind.RULE, "derived", authority=second),
+        }
+        report = ComplianceReport(DependencyGraph(nodes, []), "test_interview")
+        
+        keys = {key: key for key in report.authority_mapping}
+        assert keys["CPLR 2211"] is sys.intern("CPLR 2211")
+        assert report.authority_mapping["CPLR 308"] == ["a", "b"]
+    
     def test_missing_authorities(self):
         """Test detection of missing authority citations."""
         nodes = {
@@ -59,6 +94,21 @@ class TestComplianceReport:
         assert report.change_summary is not None
         assert report.change_summary["authority_changes"] == 1
     
+    def test_change_summary_is_lazy(self):
+        """Test that the baseline comparison runs on first access, once."""
+        old_graph = DependencyGraph({"x": Node("x", NodeKind.VARIABLE, "derived")}, [])
+        new_graph = DependencyGraph({"y": Node("y", NodeKind.VARIABLE, "derived")}, [])
+        
+        compare_target = "docassemble_dag.compliance.compare_graphs"
+        with patch(compare_target, wraps=compare_graphs) as mock_compare:
+            report = ComplianceReport(new_graph, "test", baseline_graph=old_graph)
+            mock_compare.assert_not_called()
+            
+            summary = report.change_summary
+            assert summary["added_nodes"] == 1
+            assert report.to_dict()["change_summary"] is summary
+            assert mock_compare.call_count == 1
+    
     def test_generate_html(self):
         """Test generating HTML compliance report."""
         nodes = {
@@ -59,6 +59,26 @@ class TestConditionalDependency:
         assert "age" in cond_dep.dependencies
         assert "True" not in cond_dep.dependencies
         assert "and" not in cond_dep.dependencies
+    
+    def test_expression_ignores_attributes_and_strings(self):
+        """Test that attribute names and string literals are not dependencies."""
+        cond_dep = ConditionalDependency(
+            directive="show if",
+            condition="person.age >= 18 and status == 'married'",
+            dependent_node="ask_question",
+        )
+        
+        assert cond_dep.dependencies == {"person", "status"}
+    
+    def test_unparseable_condition_falls_back_to_regex(self):
+        """Test that conditions that are not valid Python still yield names."""
+        cond_dep = ConditionalDependency(
+            directive="show if",
+            condition="age >= 18 and (",
+            dependent_node="ask_question",
+        )
+        
+        assert cond_dep.dependencies == {"age"}
 
 
 class TestConditionalExtraction:
@@ -73,6 +73,16 @@ class TestSQLiteBackend:
         assert conn is not None
         conn.close()
     
+    def test_connect_file_sets_pragmas(self, tmp_path):
+        """Test that file connections enable WAL and relaxed syncing."""
+        backend = SQLiteBackend()
+        conn = backend.connect(str(tmp_path / "graphs.db"))
+        
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        
+        conn.close()
+    
     def test_create_schema(self):
         """Test SQLite schema creation."""
         backend = SQLiteBackend()
@@ -90,6 +100,31 @@ class TestSQLiteBackend:
         assert "nodes" in tables
         assert "edges" in tables
         
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='index' AND name LIKE 'idx_%'")
+        indexes = {row[0] for row in cursor.fetchall()}
+        assert indexes == {
+            "idx_nodes_graph", "idx_nodes_name",
+            "idx_edges_graph", "idx_edges_from", "idx_edges_to",
+        }
+        
+        # Schema creation is idempotent
+        backend.create_schema(cursor)
+        
+        cursor.close()
+        conn.close()
+    
+    def test_insert_rows(self):
+        """Test batched row insertion."""
+        backend = SQLiteBackend()
+        conn = backend.connect(":memory:")
+        cursor = conn.cursor()
+        cursor.execute("CREATE TABLE test (id INTEGER, name TEXT)")
+        
+        backend.insert_rows(cursor, "test", ("id", "name"), ((i, f"n{i}") for i in range(3)))
+        
+        cursor.execute("SELECT id, name FROM test ORDER BY id")
+        assert [tuple(row) for row in cursor.fetchall()] == [(0, "n0"), (1, "n1"), (2, "n2")]
+        
         cursor.close()
         conn.close()
     
@@ -4,11 +4,13 @@ Tests for decision tree extraction and visualization.
 
 import pytest
 from docassemble_dag.decision_trees import (
+    MAX_DECISION_TREE_DEPTH,
     DecisionNode,
     DecisionTree,
     decision_tree_to_dot,
     extract_decision_tree,
 )
+from docassemble_dag.exceptions import GraphError
 from docassemble_dag.graph import DependencyGraph
 from docassemble_dag.types import Node, NodeKind, Edge, DependencyType
 from docassemble_dag.conditional import ConditionalDependency
@@ -36,6 +38,40 @@ class TestDecisionTree:
         assert tree.root.name == "root"
         assert len(tree.root.children) == 2
     
+    def test_diamond_nodes_appear_once(self):
+        """Test that a node reachable along two paths is attached only once."""
+        names = ["root", "left", "right", "leaf"]
+        nodes = {name: Node(name, NodeKind.VARIABLE, "derived") for name in names}
+        edges = [
+            Edge("root", "left", DependencyType.IMPLICIT),
+            Edge("root", "right", DependencyType.IMPLICIT),
+            Edge("left", "leaf", DependencyType.IMPLICIT),
+            Edge("right", "leaf", DependencyType.IMPLICIT),
+        ]
+        graph = DependencyGraph(nodes, edges)
+        
+        tree = extract_decision_tree(graph, "root")
+        
+        left, right = tree.root.children
+        assert [c.name for c in left.children] == ["leaf"]
+        assert right.children == []
+        assert set(tree.nodes) == set(names)
+    
+    def test_depth_limit(self):
+        """Test that very deep chains raise GraphError instead of recursing."""
+        names = [f"n{i}" for i in range(MAX_DECISION_TREE_DEPTH + 2)]
+        nodes = {name: Node(name, NodeKind.VARIABLE, "derived") for name in names}
+        edges = [
+            Edge(a, b, DependencyType.IMPLICIT) for a, b in zip(names, names[1:])
+        ]
+        graph = DependencyGraph(nodes, edges)
+        
+        with pytest.raises(GraphError):
+            extract_decision_tree(graph, "n0")
+        
+        tree = extract_decision_tree(graph, names[1])
+        assert len(tree.nodes) == MAX_DECISION_TREE_DEPTH + 1
+    
     def test_tree_to_dict(self):
         """Test converting decision tree to dictionary."""
         node = DecisionNode("test", condition="age >= 18")
@@ -58,3 +94,23 @@ class TestDecisionTree:
         assert "digraph" in dot
         assert "Test_Tree" in dot
         assert "root" in dot
+    
+    def test_decision_tree_to_dot_order_and_depth(self):
+        """Test DOT output order and that deep trees do not recurse."""
+        yes, no = DecisionNode("yes"), DecisionNode("no")
+        root = DecisionNode("root", condition="x", true_branch=yes, false_branch=no,
+                            children=[DecisionNode("extra")])
+        dot = decision_tree_to_dot(DecisionTree(root, {}), "T")
+        
+        order = [line.split('"')[1] for line in dot.splitlines() if "[label=" in line]
+        assert order == ["root", "yes", "no", "extra"]
+        assert '"root" -> "yes";' in dot
+        
+        node = DecisionNode("n0")
+        deep = node
+        for i in range(1, 3000):
+            child = DecisionNode(f"n{i}")
+            node.children.append(child)
+            node = child
+        dot = decision_tree_to_dot(DecisionTree(deep, {}))
+        assert '"n2998" -> "n2999";' in dot
@@ -154,18 +154,9 @@ variables:
 class TestGraphEdgeCases:
     """Test graph edge cases and boundary conditions."""
     
-    def test_graph_with_maximum_nodes(self):
+    def test_graph_with_maximum_nodes(self, chain_graph_1000):
         """Test graph with many nodes (stress test)."""
-        nodes = {
-            f"node_{i}": Node(f"node_{i}", NodeKind.VARIABLE, "derived")
-            for i in range(1000)
-        }
-        edges = [
-            Edge(f"node_{i}", f"node_{i+1}", DependencyType.IMPLICIT)
-            for i in range(999)
-        ]
-        
-        graph = DependencyGraph(nodes, edges)
+        graph = chain_graph_1000
         
         assert len(graph.nodes) == 1000
         assert len(graph.edges) == 999
@@ -199,22 +190,16 @@ class TestGraphEdgeCases:
         # This tests that graph can handle duplicate edges
         assert len(graph.edges) == 2
     
-    def test_transitive_dependencies_with_long_chain(self):
+    def test_transitive_dependencies_with_long_chain(self, chain_graph_1000):
         """Test transitive dependencies with very long chain."""
-        nodes = {
-            f"node_{i}": Node(f"node_{i}", NodeKind.VARIABLE, "derived")
-            for i in range(100)
-        }
-        edges = [
-            Edge(f"node_{i}", f"node_{i+1}", DependencyType.IMPLICIT)
-            for i in range(99)
-        ]
-        
-        graph = DependencyGraph(nodes, edges)
+        graph = chain_graph_1000
         
         # node_0 should transitively depend on all subsequent nodes
         deps = graph.get_transitive_dependents("node_0")
-        assert len(deps) == 99
+        assert len(deps) == 999
+        
+        # and node_99 on the 99 nodes before it
+        assert len(graph.get_transitive_dependencies("node_99")) == 99
     
     def test_find_path_no_path_exists(self):
         """Test find_path when no path exists."""
@@ -508,5 +493,7 @@ rules:
         assert len(errors) == 0
         
         # Check dependency chain
-        eligible_deps = graph.get_transitive_dependencies("eligible")
-        assert "user_age" in eligible_deps or "is_adult" in eligible_deps
+        assert (
+            graph.has_transitive_dependency("eligible", "user_age")
+            or graph.has_transitive_dependency("eligible", "is_adult")
+        )
@@ -9,73 +9,129 @@ import pytest
 from pathlib import Path
 from docassemble_dag.parser import DocassembleParser
 from docassemble_dag.graph import DependencyGraph
-from docassemble_dag.validation import GraphValidator
+from docassemble_dag.validation import GraphValidator, PolicySeverity
 from docassemble_dag.types import NodeKind, DependencyType
 
 
 # Path to examples directory
 EXAMPLES_DIR = Path(__file__).parent.parent / "examples"
 
+EXAMPLE_FILES = (
+    "ny_cplr_sample.yaml",
+    "housing_eviction.yaml",
+    "name_change_gender_affirming.yaml",
+    "immigration_asylum.yaml",
+)
 
-class TestExampleFiles:
-    """Test that example files parse without errors."""
+CPLR_EXPECTED_NODES = frozenset({
+    "court_jurisdiction",
+    "motion_type",
+    "filing_deadline",
+    "service_method",
+    "service_complete",
+})
+HOUSING_OBJECTS = frozenset({"tenant", "landlord", "rental_unit", "court"})
+ASYLUM_DEADLINE_NODES = frozenset({"entry_date", "days_since_entry", "application_deadline"})
+
+# Distinct features the examples must demonstrate between them
+MIN_EXAMPLE_FEATURES = 3
+
+
+@pytest.fixture(scope="session")
+def parsed_examples():
+    """
+    Parse every example YAML file once per test session.
     
-    def test_ny_cplr_sample_parses(self):
-        """Test NY CPLR sample parses successfully."""
-        file_path = EXAMPLES_DIR / "ny_cplr_sample.yaml"
-        if not file_path.exists():
-            pytest.skip(f"Example file not found: {file_path}")
-        
-        yaml_text = file_path.read_text()
-        parser = DocassembleParser(yaml_text, file_path=str(file_path))
-        nodes = parser.extract_nodes()
-        edges = parser.extract_edges(nodes)
-        graph = DependencyGraph(nodes, edges)
-        
-        assert len(nodes) > 0
-        assert len(edges) > 0
+    Maps file name to (nodes, edges, graph), or to the exception raised
+    while parsing it. Tests share these objects and must not mutate them.
+    """
+    parsed = {}
+    for file_path in sorted(EXAMPLES_DIR.glob("*.yaml")):
+        try:
+            yaml_text = file_path.read_text()
+            parser = DocassembleParser(yaml_text, file_path=str(file_path))
+            nodes = parser.extract_nodes()
+            edges = parser.extract_edges(nodes)
+            parsed[file_path.name] = (nodes, edges, DependencyGraph(nodes, edges))
+        except Exception as e:
+            parsed[file_path.name] = e
+    return parsed
+
+
+@pytest.fixture(scope="session")
+def example_validators(parsed_examples):
+    """
+    Run GraphValidator once per successfully parsed example file.
     
-    def test_housing_eviction_parses(self):
-        """Test housing eviction example parses successfully."""
-        file_path = EXAMPLES_DIR / "housing_eviction.yaml"
-        if not file_path.exists():
-            pytest.skip(f"Example file not found: {file_path}")
-        
-        yaml_text = file_path.read_text()
-        parser = DocassembleParser(yaml_text, file_path=str(file_path))
-        nodes = parser.extract_nodes()
-        edges = parser.extract_edges(nodes)
-        graph = DependencyGraph(nodes, edges)
-        
-        assert len(nodes) > 0
-        assert len(edges) > 0
+    Maps file name to a validator whose validate_all() has already run.
+    """
+    validators = {}
+    for filename, result in parsed_examples.items():
+        if isinstance(result, Exception):
+            continue
+        validator = GraphValidator(result[2])
+        validator.validate_all()
+        validators[filename] = validator
+    return validators
+
+
+@pytest.fixture(scope="session")
+def example_summaries(parsed_examples):
+    """
+    Summarize each successfully parsed example once per test session.
     
-    def test_name_change_gender_affirming_parses(self):
-        """Test name change example parses successfully."""
-        file_path = EXAMPLES_DIR / "name_change_gender_affirming.yaml"
-        if not file_path.exists():
-            pytest.skip(f"Example file not found: {file_path}")
-        
-        yaml_text = file_path.read_text()
-        parser = DocassembleParser(yaml_text, file_path=str(file_path))
-        nodes = parser.extract_nodes()
-        edges = parser.extract_edges(nodes)
-        graph = DependencyGraph(nodes, edges)
-        
-        assert len(nodes) > 0
-        assert len(edges) > 0
+    Maps file name to a dict of the node and edge properties the feature
+    tests check, so each test does a lookup instead of rescanning the graph.
+    """
+    summaries = {}
+    for filename, result in parsed_examples.items():
+        if isinstance(result, Exception):
+            continue
+        nodes, edges, _ = result
+        authorities = []
+        kinds = set()
+        has_objects = False
+        # One pass over nodes fills every node-derived field
+        for n in nodes.values():
+            if n.authority:
+                authorities.append(n.authority)
+            kinds.add(n.kind)
+            if not has_objects and n.metadata.get("object_type"):
+                has_objects = True
+        summaries[filename] = {
+            "authorities_text": " | ".join(authorities),
+            "kinds": kinds,
+            "has_objects": has_objects,
+            "implicit_edges": sum(1 for e in edges if e.dep_type == DependencyType.IMPLICIT),
+        }
+    return summaries
+
+
+def _summary(parsed_examples, example_summaries, filename):
+    """Return the summary dict for an example, skipping if it is missing."""
+    _example(parsed_examples, filename)
+    return example_summaries[filename]
+
+
+def _example(parsed_examples, filename, skip_on_error=False):
+    """Return (nodes, edges, graph) for an example, skipping if it is missing."""
+    if filename not in parsed_examples:
+        pytest.skip(f"Example file not found: {EXAMPLES_DIR / filename}")
+    result = parsed_examples[filename]
+    if isinstance(result, Exception):
+        if skip_on_error:
+            pytest.skip(f"Could not parse {EXAMPLES_DIR / filename}: {result}")
+        raise result
+    return result
+
+
+class TestExampleFiles:
+    """Test that example files parse without errors."""
     
-    def test_immigration_asylum_parses(self):
-        """Test immigration asylum example parses successfully."""
-        file_path = EXAMPLES_DIR / "immigration_asylum.yaml"
-        if not file_path.exists():
-            pytest.skip(f"Example file not found: {file_path}")
-        
-        yaml_text = file_path.read_text()
-        parser = DocassembleParser(yaml_text, file_path=str(file_path))
-        nodes = parser.extract_nodes()
-        edges = parser.extract_edges(nodes)
-        graph = DependencyGraph(nodes, edges)
+    @pytest.mark.parametrize("filename", EXAMPLE_FILES)
+    def test_example_parses(self, parsed_examples, filename):
+        """Test each example file parses successfully."""
+        nodes, edges, _ = _example(parsed_examples, filename)
         
         assert len(nodes) > 0
         assert len(edges) > 0
@@ -85,39 +141,20 @@ class TestNYCPLRSample:
     """Detailed tests for NY CPLR sample."""
     
     @pytest.fixture
-    def cplr_graph(self):
+    def cplr_graph(self, parsed_examples):
         """Load and parse NY CPLR sample."""
-        file_path = EXAMPLES_DIR / "ny_cplr_sample.yaml"
-        if not file_path.exists():
-            pytest.skip(f"Example file not found: {file_path}")
-        
-        yaml_text = file_path.read_text()
-        parser = DocassembleParser(yaml_text, file_path=str(file_path))
-        nodes = parser.extract_nodes()
-        edges = parser.extract_edges(nodes)
-        return DependencyGraph(nodes, edges)
+        return _example(parsed_examples, "ny_cplr_sample.yaml")[2]
     
     def test_cplr_has_expected_nodes(self, cplr_graph):
         """Test CPLR sample has expected nodes."""
-        expected_nodes = {
-            "court_jurisdiction",
-            "motion_type",
-            "filing_deadline",
-            "service_method",
-            "service_complete",
-        }
-        
-        for node_name in expected_nodes:
-            assert node_name in cplr_graph.nodes, f"Missing expected node: {node_name}"
+        missing = CPLR_EXPECTED_NODES - cplr_graph.nodes.keys()
+        assert not missing, f"Missing expected nodes: {sorted(missing)}"
     
-    def test_cplr_has_authority_citations(self, cplr_graph):
+    def test_cplr_has_authority_citations(self, parsed_examples, example_summaries):
         """Test CPLR sample has authority citations."""
-        nodes_with_authority = [
-            n for n in cplr_graph.nodes.values()
-            if n.authority and "CPLR" in n.authority
-        ]
+        summary = _summary(parsed_examples, example_summaries, "ny_cplr_sample.yaml")
         
-        assert len(nodes_with_authority) > 0, "Should have nodes with CPLR citations"
+        assert "CPLR" in summary["authorities_text"], "Should have nodes with CPLR citations"
     
     def test_cplr_has_no_cycles(self, cplr_graph):
         """Test CPLR sample has no cycles."""
@@ -136,56 +173,37 @@ class TestHousingEviction:
     """Detailed tests for housing eviction example."""
     
     @pytest.fixture
-    def housing_graph(self):
+    def housing_graph(self, parsed_examples):
         """Load and parse housing eviction sample."""
-        file_path = EXAMPLES_DIR / "housing_eviction.yaml"
-        if not file_path.exists():
-            pytest.skip(f"Example file not found: {file_path}")
-        
-        yaml_text = file_path.read_text()
-        parser = DocassembleParser(yaml_text, file_path=str(file_path))
-        nodes = parser.extract_nodes()
-        edges = parser.extract_edges(nodes)
-        return DependencyGraph(nodes, edges)
+        return _example(parsed_examples, "housing_eviction.yaml")[2]
     
-    def test_housing_has_ohio_statutes(self, housing_graph):
+    def test_housing_has_ohio_statutes(self, parsed_examples, example_summaries):
         """Test housing example has Ohio statute citations."""
-        ohio_nodes = [
-            n for n in housing_graph.nodes.values()
-            if n.authority and "Ohio" in n.authority
-        ]
+        summary = _summary(parsed_examples, example_summaries, "housing_eviction.yaml")
         
-        assert len(ohio_nodes) > 0, "Should have nodes with Ohio statute citations"
+        assert "Ohio" in summary["authorities_text"], (
+            "Should have nodes with Ohio statute citations"
+        )
     
     def test_housing_has_objects(self, housing_graph):
         """Test housing example defines objects."""
         # Objects section should create nodes
-        expected_objects = {"tenant", "landlord", "rental_unit", "court"}
-        
-        found_objects = set()
-        for obj_name in expected_objects:
-            if obj_name in housing_graph.nodes:
-                found_objects.add(obj_name)
-        
-        assert len(found_objects) > 0, "Should find some object definitions"
+        found_objects = HOUSING_OBJECTS & housing_graph.nodes.keys()
+        assert found_objects, "Should find some object definitions"
     
-    def test_housing_has_conditional_logic(self, housing_graph):
+    def test_housing_has_conditional_logic(self, parsed_examples, example_summaries):
         """Test housing example has conditional dependencies."""
-        # Look for edges that came from show if / enable if
-        conditional_edges = [
-            e for e in housing_graph.edges
-            if e.dep_type == DependencyType.IMPLICIT
-        ]
+        # Edges that came from show if / enable if are implicit
+        summary = _summary(parsed_examples, example_summaries, "housing_eviction.yaml")
         
-        assert len(conditional_edges) > 0, "Should have conditional dependencies"
+        assert summary["implicit_edges"] > 0, "Should have conditional dependencies"
     
-    def test_housing_validation_passes(self, housing_graph):
+    def test_housing_validation_passes(self, housing_graph, example_validators):
         """Test housing example passes validation."""
-        validator = GraphValidator(housing_graph)
-        violations = validator.validate_all()
+        violations = example_validators["housing_eviction.yaml"].violations
         
         # Should have no critical errors
-        errors = [v for v in violations if v.severity.value == "error"]
+        errors = [v for v in violations if v.severity is PolicySeverity.ERROR]
         assert len(errors) == 0, f"Should have no validation errors, found: {errors}"
 
 
@@ -193,29 +211,16 @@ class TestNameChange:
     """Detailed tests for name change example."""
     
     @pytest.fixture
-    def name_change_graph(self):
+    def name_change_graph(self, parsed_examples):
         """Load and parse name change sample."""
-        file_path = EXAMPLES_DIR / "name_change_gender_affirming.yaml"
-        if not file_path.exists():
-            pytest.skip(f"Example file not found: {file_path}")
-        
-        try:
-            yaml_text = file_path.read_text()
-            parser = DocassembleParser(yaml_text, file_path=str(file_path))
-            nodes = parser.extract_nodes()
-            edges = parser.extract_edges(nodes)
-            return DependencyGraph(nodes, edges)
-        except Exception as e:
-            pytest.skip(f"Could not parse {file_path}: {e}")
+        return _example(parsed_examples, "name_change_gender_affirming.yaml", skip_on_error=True)[2]
     
     def test_name_change_has_assembly_line(self, name_change_graph):
         """Test name change uses Assembly Line objects."""
-        al_nodes = [
-            n for n in name_change_graph.nodes.values()
-            if n.name.startswith("AL_") or n.kind == NodeKind.ASSEMBLY_LINE
-        ]
-        
-        assert len(al_nodes) > 0, "Should have Assembly Line nodes"
+        assert any(
+            n.name.startswith("AL_") or n.kind == NodeKind.ASSEMBLY_LINE
+            for n in name_change_graph.nodes.values()
+        ), "Should have Assembly Line nodes"
     
     def test_name_change_has_jurisdiction_logic(self, name_change_graph):
         """Test name change has jurisdiction-specific logic."""
@@ -230,17 +235,9 @@ class TestImmigrationAsylum:
     """Detailed tests for immigration asylum example."""
     
     @pytest.fixture
-    def asylum_graph(self):
+    def asylum_graph(self, parsed_examples):
         """Load and parse asylum sample."""
-        file_path = EXAMPLES_DIR / "immigration_asylum.yaml"
-        if not file_path.exists():
-            pytest.skip(f"Example file not found: {file_path}")
-        
-        yaml_text = file_path.read_text()
-        parser = DocassembleParser(yaml_text, file_path=str(file_path))
-        nodes = parser.extract_nodes()
-        edges = parser.extract_edges(nodes)
-        return DependencyGraph(nodes, edges)
+        return _example(parsed_examples, "immigration_asylum.yaml")[2]
     
     def test_asylum_has_multilanguage(self, asylum_graph):
         """Test asylum example has multi-language support."""
@@ -250,84 +247,48 @@ class TestImmigrationAsylum:
     def test_asylum_has_deadline_calculation(self, asylum_graph):
         """Test asylum example has deadline calculation."""
         # Should have deadline-related nodes
-        deadline_nodes = [
-            "entry_date",
-            "days_since_entry",
-            "application_deadline"
-        ]
-        
-        found = [n for n in deadline_nodes if n in asylum_graph.nodes]
-        assert len(found) > 0, "Should have deadline calculation nodes"
+        found = ASYLUM_DEADLINE_NODES & asylum_graph.nodes.keys()
+        assert found, "Should have deadline calculation nodes"
     
-    def test_asylum_has_immigration_citations(self, asylum_graph):
+    def test_asylum_has_immigration_citations(self, parsed_examples, example_summaries):
         """Test asylum example has immigration law citations."""
-        usc_nodes = [
-            n for n in asylum_graph.nodes.values()
-            if n.authority and ("USC" in n.authority or "CFR" in n.authority)
-        ]
+        summary = _summary(parsed_examples, example_summaries, "immigration_asylum.yaml")
+        authorities_text = summary["authorities_text"]
         
-        assert len(usc_nodes) > 0, "Should have immigration law citations"
+        assert "USC" in authorities_text or "CFR" in authorities_text, (
+            "Should have immigration law citations"
+        )
 
 
 class TestExamplesIntegration:
     """Integration tests across all examples."""
     
-    def test_all_examples_parse_without_errors(self):
+    def test_all_examples_parse_without_errors(self, parsed_examples):
         """Test all example files parse successfully."""
-        example_files = [
-            "ny_cplr_sample.yaml",
-            "housing_eviction.yaml",
-            "name_change_gender_affirming.yaml",
-            "immigration_asylum.yaml",
-        ]
-        
-        for filename in example_files:
-            file_path = EXAMPLES_DIR / filename
-            if not file_path.exists():
+        for filename in EXAMPLE_FILES:
+            if filename not in parsed_examples:
                 continue
             
-            yaml_text = file_path.read_text()
-            parser = DocassembleParser(yaml_text, file_path=str(file_path))
-            nodes = parser.extract_nodes()
-            edges = parser.extract_edges(nodes)
-            graph = DependencyGraph(nodes, edges)
+            nodes, edges, graph = _example(parsed_examples, filename)
             
             # Basic sanity checks
             assert len(nodes) > 0, f"{filename} should have nodes"
             assert isinstance(graph, DependencyGraph), f"{filename} should create valid graph"
     
-    def test_all_examples_have_no_critical_errors(self):
+    def test_all_examples_have_no_critical_errors(self, parsed_examples, example_validators):
         """Test all examples pass basic validation."""
-        example_files = [
-            "ny_cplr_sample.yaml",
-            "housing_eviction.yaml",
-            "name_change_gender_affirming.yaml",
-            "immigration_asylum.yaml",
-        ]
-        
-        for filename in example_files:
-            file_path = EXAMPLES_DIR / filename
-            if not file_path.exists():
+        for filename in EXAMPLE_FILES:
+            if filename not in parsed_examples:
                 continue
             
-            yaml_text = file_path.read_text()
-            parser = DocassembleParser(yaml_text, file_path=str(file_path))
-            nodes = parser.extract_nodes()
-            edges = parser.extract_edges(nodes)
-            graph = DependencyGraph(nodes, edges)
-            
-            validator = GraphValidator(graph)
-            violations = validator.validate_all()
+            _example(parsed_examples, filename)
             
             # Should have no critical errors (cycles, undefined references)
-            critical_errors = [
-                v for v in violations
-                if v.severity.value == "error" and v.rule_name in ["no_cycles", "no_undefined_references"]
-            ]
+            critical_errors = example_validators[filename].get_critical_violations()
             
             assert len(critical_errors) == 0, f"{filename} should have no critical errors"
     
-    def test_examples_demonstrate_different_features(self):
+    def test_examples_demonstrate_different_features(self, parsed_examples, example_summaries):
         """Test that examples showcase different features."""
         features_found = {
             "authority_citations": False,
@@ -337,41 +298,35 @@ class TestExamplesIntegration:
             "conditional_logic": False,
         }
         
-        example_files = list((EXAMPLES_DIR).glob("*.yaml"))
-        
-        for file_path in example_files:
-            if file_path.name.startswith("test_"):
+        # Files that don't parse have no summary
+        for filename, summary in example_summaries.items():
+            if filename.startswith("test_"):
                 continue
             
-            try:
-                yaml_text = file_path.read_text()
-                parser = DocassembleParser(yaml_text, file_path=str(file_path))
-                nodes = parser.extract_nodes()
-                edges = parser.extract_edges(nodes)
-                
-                # Check for authority citations
-                if any(n.authority for n in nodes.values()):
-                    features_found["authority_citations"] = True
-                
-                # Check for Assembly Line
-                if any(n.kind == NodeKind.ASSEMBLY_LINE for n in nodes.values()):
-                    features_found["assembly_line"] = True
-                
-                # Check for objects (metadata with object_type)
-                if any(n.metadata.get("object_type") for n in nodes.values()):
-                    features_found["objects"] = True
-                
-                # Check for multi-language (primary_language variable)
-                if "primary_language" in nodes:
-                    features_found["multi_language"] = True
-                
-                # Check for conditional logic (show if, enable if)
-                if any(e.dep_type == DependencyType.IMPLICIT for e in edges):
-                    features_found["conditional_logic"] = True
+            # Check for authority citations
+            if summary["authorities_text"]:
+                features_found["authority_citations"] = True
             
-            except Exception:
-                # Skip files that don't parse
-                continue
+            # Check for Assembly Line
+            if NodeKind.ASSEMBLY_LINE in summary["kinds"]:
+                features_found["assembly_line"] = True
+            
+            # Check for objects (metadata with object_type)
+            if summary["has_objects"]:
+                features_found["objects"] = True
+            
+            # Check for multi-language (primary_language variable)
+            if "primary_language" in parsed_examples[filename][0]:
+                features_found["multi_language"] = True
+            
+            # Check for conditional logic (show if, enable if)
+            if summary["implicit_edges"]:
+                features_found["conditional_logic"] = True
+            
+            if sum(features_found.values()) >= MIN_EXAMPLE_FEATURES:
+                break
         
         # At least some features should be demonstrated
-        assert sum(features_found.values()) >= 3, "Examples should demonstrate multiple features"
+        assert sum(features_found.values()) >= MIN_EXAMPLE_FEATURES, (
+            "Examples should demonstrate multiple features"
+        )
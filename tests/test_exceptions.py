@@ -25,51 +25,30 @@ class TestExceptions:
         assert str(error) == "Test error"
         assert isinstance(error, Exception)
     
-    def test_invalid_yaml_error(self):
-        """Test InvalidYAMLError with context."""
-        error = InvalidYAMLError(
-            "Invalid YAML",
-            file_path="test.yaml",
-            line_number=42,
-        )
-        assert error.file_path == "test.yaml"
-        assert error.line_number == 42
-    
-    def test_parsing_error(self):
-        """Test ParsingError."""
-        original = ValueError("Original error")
-        error = ParsingError(
+    @pytest.mark.parametrize("exc_cls, message, kwargs", [
+        (InvalidYAMLError, "Invalid YAML", {"file_path": "test.yaml", "line_number": 42}),
+        (
+            ParsingError,
             "Parsing failed",
-            file_path="test.yaml",
-            original_error=original,
-        )
-        assert error.file_path == "test.yaml"
-        assert error.original_error == original
-    
-    def test_graph_error(self):
-        """Test GraphError with node name."""
-        error = GraphError("Graph error", node_name="test_node")
-        assert error.node_name == "test_node"
-    
-    def test_cycle_error(self):
-        """Test CycleError with cycles."""
-        cycles = [["A", "B", "A"], ["C", "D", "C"]]
-        error = CycleError("Cycles found", cycles=cycles)
-        assert error.cycles == cycles
-    
-    def test_validation_error(self):
-        """Test ValidationError with violations."""
-        violations = [{"rule": "no_cycles", "severity": "error"}]
-        error = ValidationError("Validation failed", violations=violations)
-        assert error.violations == violations
-    
-    def test_storage_error(self):
-        """Test StorageError with operation and original error."""
-        original = sqlite3.Error("DB error")
-        error = StorageError(
+            {"file_path": "test.yaml", "original_error": ValueError("Original error")},
+        ),
+        (GraphError, "Graph error", {"node_name": "test_node"}),
+        (CycleError, "Cycles found", {"cycles": [["A", "B", "A"], ["C", "D", "C"]]}),
+        (
+            ValidationError,
+            "Validation failed",
+            {"violations": [{"rule": "no_cycles", "severity": "error"}]},
+        ),
+        (
+            StorageError,
             "Storage failed",
-            operation="save_graph",
-            original_error=original,
-        )
-        assert error.operation == "save_graph"
-        assert error.original_error == original
+            {"operation": "save_graph", "original_error": sqlite3.Error("DB error")},
+        ),
+    ])
+    def test_exception_context(self, exc_cls, message, kwargs):
+        """Test each exception keeps its message and context attributes."""
+        error = exc_cls(message, **kwargs)
+        assert isinstance(error, DocassembleDAGError)
+        assert str(error) == message
+        for attr, expected in kwargs.items():
+            assert getattr(error, attr) == expected
@@ -2,7 +2,15 @@
 Unit tests for DependencyGraph.
 """
 
+import copy
+import dataclasses
+import json
+import sys
+
 import pytest
+from unittest.mock import patch
+from docassemble_dag import graph as graph_module
+from docassemble_dag.exceptions import GraphError
 from docassemble_dag.graph import DependencyGraph
 from docassemble_dag.types import Node, NodeKind, Edge, DependencyType
 
@@ -19,6 +27,33 @@ class TestDependencyGraph:
         assert not graph.has_cycles()
         assert graph.find_cycles() == []
     
+    def test_edgeless_graphs_share_empty_adjacency(self):
+        """Test that graphs without edges reuse one read-only adjacency."""
+        first = DependencyGraph({"A": Node("A", NodeKind.VARIABLE, "derived")}, [])
+        second = DependencyGraph({}, [])
+        
+        assert first.adj is second.adj is first.rev
+        assert first.get_dependents("A") == []
+        assert first.get_transitive_dependencies("A") == set()
+        with pytest.raises(TypeError):
+            first.adj["A"] = ["B"]
+    
+    def test_from_trusted_matches_validated_graph(self):
+        """Test that from_trusted builds the same indices without validation."""
+        nodes = {
+            "A": Node("A", NodeKind.VARIABLE, "user_input"),
+            "B": Node("B", NodeKind.VARIABLE, "derived"),
+        }
+        edges = [Edge("A", "B", DependencyType.IMPLICIT)]
+        
+        graph = DependencyGraph.from_trusted(nodes, edges)
+        
+        assert graph.nodes is nodes
+        assert graph.edges is edges
+        assert graph.get_dependents("A") == ["B"]
+        assert graph.get_transitive_dependencies("B") == {"A"}
+        assert graph.to_json_struct() == DependencyGraph(nodes, edges).to_json_struct()
+    
     def test_simple_acyclic_graph(self):
         """Test a simple acyclic dependency graph."""
         nodes = {
@@ -75,6 +110,46 @@ class TestDependencyGraph:
         cycles = graph.find_cycles()
         assert len(cycles) > 0
     
+    def test_has_cycles_on_stacked_diamonds(self):
+        """Test cycle check stays linear when many paths share nodes."""
+        names = [f"n{i}" for i in range(200)]
+        nodes = {name: Node(name, NodeKind.VARIABLE, "derived") for name in names}
+        edges = [Edge(a, b, DependencyType.IMPLICIT) for a, b in zip(names, names[1:])]
+        edges += [Edge(names[i], names[i + 2], DependencyType.IMPLICIT) for i in range(0, 80, 2)]
+        
+        assert not DependencyGraph(nodes, edges).has_cycles()
+        
+        edges.append(Edge(names[-1], names[100], DependencyType.IMPLICIT))
+        assert DependencyGraph(nodes, edges).has_cycles()
+    
+    def test_find_cycles_on_stacked_diamonds(self):
+        """Test cycle enumeration stays linear when many paths share nodes."""
+        names = [f"n{i}" for i in range(2000)]
+        nodes = {name: Node(name, NodeKind.VARIABLE, "derived") for name in names}
+        edges = [Edge(a, b, DependencyType.IMPLICIT) for a, b in zip(names, names[1:])]
+        edges += [Edge(names[i], names[i + 2], DependencyType.IMPLICIT) for i in range(0, 1990, 2)]
+        
+        assert DependencyGraph(nodes, edges).find_cycles() == []
+        
+        edges.append(Edge(names[-1], names[0], DependencyType.IMPLICIT))
+        cycles = DependencyGraph(nodes, edges).find_cycles()
+        
+        assert len(cycles) == 1
+        cycle = cycles[0]
+        assert cycle[0] == cycle[-1] == "n0"
+        edge_pairs = {(e.from_node, e.to_node) for e in edges}
+        assert all(pair in edge_pairs for pair in zip(cycle, cycle[1:]))
+    
+    def test_has_cycles_is_cached(self):
+        """Test that the cycle check runs once per graph."""
+        nodes = {name: Node(name, NodeKind.VARIABLE, "derived") for name in ["A", "B"]}
+        graph = DependencyGraph(nodes, [Edge("A", "B", DependencyType.IMPLICIT)])
+        
+        assert not graph.has_cycles()
+        with patch.object(DependencyGraph, "_detect_cycle", side_effect=AssertionError("rerun")):
+            assert not graph.has_cycles()
+            assert not DependencyGraph(nodes, []).has_cycles()
+    
     def test_no_cycles_with_self_reference(self):
         """Test that self-reference doesn't count as a cycle (since we filter those)."""
         nodes = {
@@ -202,6 +277,148 @@ class TestDependencyGraph:
         assert "B" in deps
         assert len(deps) == 2
     
+    def test_iter_and_has_transitive_dependency(self):
+        """Test lazy transitive dependency queries match the eager set."""
+        names = ["A", "B", "C", "D"]
+        nodes = {name: Node(name, NodeKind.VARIABLE, "derived") for name in names}
+        edges = [
+            Edge("A", "B", DependencyType.IMPLICIT),
+            Edge("B", "C", DependencyType.IMPLICIT),
+            Edge("A", "C", DependencyType.IMPLICIT),
+        ]
+        graph = DependencyGraph(nodes, edges)
+        
+        lazy = list(graph.iter_transitive_dependencies("C"))
+        assert sorted(lazy) == ["A", "B"]
+        assert set(lazy) == graph.get_transitive_dependencies("C")
+        assert sorted(graph.iter_transitive_dependencies("C")) == ["A", "B"]  # from cache
+        
+        assert graph.has_transitive_dependency("C", "A")
+        assert not graph.has_transitive_dependency("A", "C")
+        assert not graph.has_transitive_dependency("C", "D")
+        assert not graph.has_transitive_dependency("C", "missing")
+        assert not graph.has_transitive_dependency("missing", "A")
+        assert list(graph.iter_transitive_dependencies("missing")) == []
+    
+    def test_precomputed_transitive_closures_match_traversal(self):
+        """Test bitset closures give the same answers as per-node traversal."""
+        names = ["A", "B", "C", "D", "E"]
+        nodes = {name: Node(name, NodeKind.VARIABLE, "derived") for name in names}
+        edges = [
+            Edge("A", "B", DependencyType.IMPLICIT),
+            Edge("B", "C", DependencyType.IMPLICIT),
+            Edge("A", "C", DependencyType.IMPLICIT),
+            Edge("D", "C", DependencyType.IMPLICIT),
+        ]
+        traversed = DependencyGraph(nodes, edges)
+        precomputed = DependencyGraph(nodes, edges)
+        
+        assert precomputed.precompute_transitive_closures()
+        for name in names:
+            dependencies = traversed.get_transitive_dependencies(name)
+            dependents = traversed.get_transitive_dependents(name)
+            assert precomputed.get_transitive_dependencies(name) == dependencies
+            assert precomputed.get_transitive_dependents(name) == dependents
+            for other in names:
+                assert precomputed.has_transitive_dependency(name, other) == (
+                    traversed.has_transitive_dependency(name, other)
+                )
+        
+        edges.append(Edge("C", "A", DependencyType.IMPLICIT))
+        cyclic = DependencyGraph(nodes, edges)
+        assert not cyclic.precompute_transitive_closures()
+        assert cyclic.get_transitive_dependencies("A") == {"A", "B", "C", "D"}
+    
+    def test_transitive_queries_are_memoized(self):
+        """Test that repeated transitive queries reuse the cached result."""
+        nodes = {
+            "A": Node("A", NodeKind.VARIABLE, "user_input"),
+            "B": Node("B", NodeKind.VARIABLE, "derived"),
+            "C": Node("C", NodeKind.VARIABLE, "derived"),
+        }
+        edges = [
+            Edge("A", "B", DependencyType.IMPLICIT),
+            Edge("B", "C", DependencyType.IMPLICIT),
+        ]
+        graph = DependencyGraph(nodes, edges)
+        
+        deps = graph.get_transitive_dependencies("C")
+        dependents = graph.get_transitive_dependents("A")
+        deps.add("ZZZ")
+        dependents.add("ZZZ")
+        
+        # Later calls reuse the cache and are not affected by caller edits
+        with patch.object(graph, "_reachable") as reachable:
+            assert graph.get_transitive_dependencies("C") == {"A", "B"}
+            assert graph.get_transitive_dependents("A") == {"B", "C"}
+            assert set(graph.iter_transitive_dependencies("C")) == {"A", "B"}
+            reachable.assert_not_called()
+    
+    def test_transitive_queries_with_cycle(self):
+        """Test transitive queries on a cycle, including the start node."""
+        nodes = {
+            name: Node(name, NodeKind.VARIABLE, "derived")
+            for name in ["A", "B", "C", "D"]
+        }
+        edges = [
+            Edge("A", "B", DependencyType.IMPLICIT),
+            Edge("B", "C", DependencyType.IMPLICIT),
+            Edge("C", "A", DependencyType.IMPLICIT),
+            Edge("C", "D", DependencyType.IMPLICIT),
+        ]
+        graph = DependencyGraph(nodes, edges)
+    
+        assert graph.get_transitive_dependents("A") == {"A", "B", "C", "D"}
+        assert graph.get_transitive_dependencies("A") == {"A", "B", "C"}
+        assert graph.get_transitive_dependents("D") == set()
+        assert graph.get_transitive_dependencies("D") == {"A", "B", "C"}
+        assert graph.get_transitive_dependencies("missing") == set()
+    
+    def test_get_transitive_dependents_of_many(self):
+        """Test the union of transitive dependents in a single traversal."""
+        nodes = {
+            name: Node(name, NodeKind.VARIABLE, "derived")
+            for name in ["A", "B", "C", "D", "E"]
+        }
+        edges = [
+            Edge("A", "C", DependencyType.IMPLICIT),
+            Edge("B", "C", DependencyType.IMPLICIT),
+            Edge("C", "D", DependencyType.IMPLICIT),
+            Edge("B", "A", DependencyType.IMPLICIT),
+        ]
+        graph = DependencyGraph(nodes, edges)
+        
+        assert graph.get_transitive_dependents_of(["A", "B"]) == {"A", "C", "D"}
+        assert graph.get_transitive_dependents_of(["C"]) == {"D"}
+        assert graph.get_transitive_dependents_of([]) == set()
+        with pytest.raises(GraphError):
+            graph.get_transitive_dependents_of(["A", "missing"])
+    
+    def test_node_names_are_interned(self):
+        """Test that edge endpoints and index names are interned."""
+        name_a = "".join(["node", "_a"])
+        nodes = {
+            name_a: Node(name_a, NodeKind.VARIABLE, "user_input"),
+            "node_b": Node("node_b", NodeKind.VARIABLE, "derived"),
+        }
+        edge = Edge("".join(["node", "_a"]), "node_b", DependencyType.IMPLICIT)
+        graph = DependencyGraph(nodes, [edge])
+        
+        assert edge.from_node is sys.intern("node_a")
+        assert graph.get_dependents("node_a") == ["node_b"]
+        assert graph.get_transitive_dependencies("node_b") == {"node_a"}
+        assert next(iter(graph._node_ids)) is sys.intern("node_a")
+    
+    def test_nodes_dict_is_kept_for_uninterned_keys(self):
+        """Test that the caller's nodes dict is used as-is, interned or not."""
+        nodes = {f"n{i}": Node(f"n{i}", NodeKind.VARIABLE, "derived") for i in range(3)}
+        edges = [Edge(f"n{i}", f"n{i + 1}", DependencyType.IMPLICIT) for i in range(2)]
+        graph = DependencyGraph(nodes, edges)
+        
+        assert graph.nodes is nodes
+        assert graph.get_dependents("n0") == ["n1"]
+        assert graph.get_transitive_dependents("n0") == {"n1", "n2"}
+    
     def test_get_transitive_dependents(self):
         """Test getting all transitive dependents."""
         nodes = {
@@ -248,6 +465,31 @@ class TestDependencyGraph:
         path = graph.find_path("C", "A")
         assert path is None
     
+    def test_find_path_is_shortest(self):
+        """Test find_path returns a shortest path when several exist."""
+        names = ["start", "x1", "x2", "x3", "x4", "y1", "y2", "end"]
+        nodes = {name: Node(name, NodeKind.VARIABLE, "derived") for name in names}
+        edges = [
+            # Long branch: start -> x1 -> x2 -> x3 -> x4 -> end
+            Edge("start", "x1", DependencyType.IMPLICIT),
+            Edge("x1", "x2", DependencyType.IMPLICIT),
+            Edge("x2", "x3", DependencyType.IMPLICIT),
+            Edge("x3", "x4", DependencyType.IMPLICIT),
+            Edge("x4", "end", DependencyType.IMPLICIT),
+            # Short branch: start -> y1 -> y2 -> end
+            Edge("start", "y1", DependencyType.IMPLICIT),
+            Edge("y1", "y2", DependencyType.IMPLICIT),
+            Edge("y2", "end", DependencyType.IMPLICIT),
+            # Fan-in to end so the backward frontier is the larger one
+            Edge("x2", "end", DependencyType.IMPLICIT),
+        ]
+        graph = DependencyGraph(nodes, edges)
+        
+        path = graph.find_path("start", "end")
+        assert path in (["start", "x1", "x2", "end"], ["start", "y1", "y2", "end"])
+        assert graph.find_path("x3", "end") == ["x3", "x4", "end"]
+        assert graph.find_path("end", "start") is None
+    
     def test_find_nodes_by_kind(self):
         """Test finding nodes by kind."""
         nodes = {
@@ -270,6 +512,11 @@ class TestDependencyGraph:
         
         rules = graph.find_nodes_by_kind(NodeKind.RULE)
         assert rules == ["r1"]
+        
+        # Results are copies of the cached index, so callers may mutate them
+        rules.append("extra")
+        assert graph.find_nodes_by_kind(NodeKind.RULE) == ["r1"]
+        assert graph.find_nodes_by_kind(NodeKind.ASSEMBLY_LINE) == []
     
     def test_find_roots(self):
         """Test finding root nodes."""
@@ -310,6 +557,105 @@ class TestDependencyGraph:
         assert "B" not in orphans  # B has C as dependent
         assert "C" not in orphans  # C depends on B
     
+    def test_find_orphans_order(self):
+        """Test that orphans keep node order, with and without edges."""
+        nodes = {name: Node(name, NodeKind.VARIABLE, "derived") for name in ["d", "a", "c", "b"]}
+        
+        assert DependencyGraph(nodes, []).find_orphans() == ["d", "a", "c", "b"]
+        
+        graph = DependencyGraph(nodes, [Edge("a", "b", DependencyType.IMPLICIT)])
+        assert graph.find_orphans() == ["d", "c"]
+    
+    def test_edgeless_graph_adjacency_indexing(self):
+        """Test adj/rev on an edgeless graph read missing names as empty."""
+        nodes = {"a": Node("a", NodeKind.VARIABLE, "derived")}
+        graph = DependencyGraph(nodes, [])
+        
+        assert list(graph.adj["a"]) == []
+        assert list(graph.rev["missing"]) == []
+        assert graph.get_dependencies("a") == []
+    
+    def test_add_edge_to_edgeless_graph_leaves_shared_adjacency_empty(self):
+        """Test add_edge replaces, rather than writes into, the shared empty mapping."""
+        nodes = {name: Node(name, NodeKind.VARIABLE, "derived") for name in ["a", "b"]}
+        graph = DependencyGraph(nodes, [])
+        other = DependencyGraph(dict(nodes), [])
+        assert graph.adj is graph_module._EMPTY_ADJ
+        
+        graph.add_edge(Edge("a", "b", DependencyType.IMPLICIT))
+        
+        assert graph.adj is not graph_module._EMPTY_ADJ
+        assert graph.rev is not graph_module._EMPTY_ADJ
+        assert len(graph_module._EMPTY_ADJ) == 0
+        assert graph.get_dependents("a") == ["b"]
+        assert other.get_dependents("a") == []
+    
+    def test_roots_and_orphans_are_cached_copies(self):
+        """Test cached roots/orphans are not affected by mutating a result."""
+        nodes = {name: Node(name, NodeKind.VARIABLE, "derived") for name in ["a", "b", "c"]}
+        graph = DependencyGraph(nodes, [Edge("a", "b", DependencyType.IMPLICIT)])
+        
+        roots = graph.find_roots()
+        orphans = graph.find_orphans()
+        roots.clear()
+        orphans.append("b")
+        
+        assert graph.find_roots() == ["a", "c"]
+        assert graph.find_orphans() == ["c"]
+    
+    def test_add_and_remove_edge_update_cached_results(self):
+        """Test incremental edits match a graph built from the final edges."""
+        nodes = {name: Node(name, NodeKind.VARIABLE, "derived") for name in ["a", "b", "c", "d"]}
+        edges = [Edge("a", "b", DependencyType.IMPLICIT), Edge("c", "d", DependencyType.IMPLICIT)]
+        graph = DependencyGraph(nodes, list(edges))
+        graph.precompute_transitive_closures()
+        # Populate the caches the edits must keep current
+        assert not graph.has_cycles()
+        assert graph.get_transitive_dependents("a") == {"b"}
+        assert graph.get_transitive_dependencies("d") == {"c"}
+        assert graph.find_roots() == ["a", "c"]
+        
+        bridge = Edge("b", "c", DependencyType.EXPLICIT)
+        graph.add_edge(bridge)
+        
+        assert graph.get_transitive_dependents("a") == {"b", "c", "d"}
+        assert graph.get_transitive_dependencies("d") == {"a", "b", "c"}
+        assert graph.has_transitive_dependency("d", "a")
+        assert graph.find_roots() == ["a"]
+        assert not graph.has_cycles()
+        
+        back = Edge("d", "a", DependencyType.EXPLICIT)
+        graph.add_edge(back)
+        assert graph.has_cycles()
+        
+        graph.remove_edge(back)
+        graph.remove_edge(bridge)
+        fresh = DependencyGraph(nodes, list(edges))
+        
+        assert not graph.has_cycles()
+        assert graph.edges == edges
+        for name in nodes:
+            assert graph.get_transitive_dependents(name) == fresh.get_transitive_dependents(name)
+            expected = fresh.get_transitive_dependencies(name)
+            assert graph.get_transitive_dependencies(name) == expected
+        assert graph.find_roots() == fresh.find_roots()
+    
+    def test_add_and_remove_edge_errors(self):
+        """Test edits referencing unknown nodes or edges raise GraphError."""
+        nodes = {"a": Node("a", NodeKind.VARIABLE, "derived")}
+        edges = []
+        graph = DependencyGraph(nodes, edges)
+        
+        with pytest.raises(GraphError):
+            graph.add_edge(Edge("a", "missing", DependencyType.IMPLICIT))
+        with pytest.raises(GraphError):
+            graph.remove_edge(Edge("a", "a", DependencyType.IMPLICIT))
+        
+        graph.add_edge(Edge("a", "a", DependencyType.IMPLICIT))
+        # The caller's list is copied rather than mutated
+        assert edges == []
+        assert graph.has_cycles()
+    
     def test_to_dot(self):
         """Test DOT format export."""
         nodes = {
@@ -352,6 +698,26 @@ class TestDependencyGraph:
         assert "age" in graphml
         assert "is_adult" in graphml
     
+    def test_write_graphml_streams_same_document(self, tmp_path):
+        """Test streamed GraphML chunks and file output match to_graphml."""
+        nodes = {
+            "a&b": Node("a&b", NodeKind.VARIABLE, "user_input", authority="<CPLR>"),
+            "c": Node("c", NodeKind.VARIABLE, "derived", line_number=3),
+        }
+        edges = [Edge("a&b", "c", DependencyType.EXPLICIT, line_number=7)]
+        graph = DependencyGraph(nodes, edges)
+        
+        expected = graph.to_graphml(graph_id="g")
+        chunks = list(graph.iter_graphml(graph_id="g"))
+        output_path = tmp_path / "graph.graphml"
+        graph.write_graphml(output_path, graph_id="g")
+        
+        assert len(chunks) > 1
+        assert "".join(chunks) == expected
+        assert output_path.read_text(encoding="utf-8") == expected
+        assert '<node id="a&amp;b">' in expected
+        assert "&lt;CPLR&gt;" in expected
+    
     def test_to_json_struct_with_metadata(self):
         """Test JSON output includes metadata fields."""
         nodes = {
@@ -377,3 +743,73 @@ class TestDependencyGraph:
         edge = json_struct["edges"][0]
         assert edge["file_path"] == "test.yaml"
         assert edge["line_number"] == 10
+    
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_to_json_bytes(self, use_orjson):
+        """Test JSON bytes match the struct with or without orjson installed."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        nodes = {
+            "age": Node("age", NodeKind.VARIABLE, "user_input", authority="Código § 5",
+                        metadata={1: "int key"}),
+            "is_adult": Node("is_adult", NodeKind.VARIABLE, "derived"),
+        }
+        graph = DependencyGraph(nodes, [Edge("age", "is_adult", DependencyType.IMPLICIT)])
+        expected = json.loads(json.dumps(graph.to_json_struct()))
+        
+        with patch.object(graph_module, "orjson", graph_module.orjson if use_orjson else None):
+            compact = graph.to_json_bytes()
+            pretty = graph.to_json_bytes(pretty=True)
+        
+        assert json.loads(compact) == json.loads(pretty) == expected
+        assert b"\n" not in compact
+        assert pretty.startswith(b'{\n  "nodes": [')
+        assert "Código".encode("utf-8") in compact
+
+
+class TestSlottedTypes:
+    """Test the slotted Node and Edge dataclasses."""
+    
+    def test_node_has_no_instance_dict(self):
+        """Test that Node uses __slots__ but keeps dataclass behaviour."""
+        node = Node("A", NodeKind.VARIABLE, "derived", authority="CPLR 308")
+        
+        assert not hasattr(node, "__dict__")
+        assert node == Node("A", NodeKind.VARIABLE, "derived", authority="CPLR 308")
+        assert node != Node("A", NodeKind.VARIABLE, "derived")
+        assert node.metadata == {}
+    
+    def test_edge_has_no_instance_dict(self):
+        """Test that Edge uses __slots__ but keeps dataclass behaviour."""
+        edge = Edge("A", "B", DependencyType.IMPLICIT)
+        
+        assert not hasattr(edge, "__dict__")
+        assert edge == Edge("A", "B", DependencyType.IMPLICIT)
+        assert edge.file_path is None
+        assert edge.metadata == {}
+        assert "from_node='A'" in repr(edge)
+    
+    def test_edge_metadata_not_shared(self):
+        """Test that default metadata dicts are per-instance."""
+        edge1 = Edge("A", "B", DependencyType.IMPLICIT)
+        edge2 = Edge("B", "C", DependencyType.IMPLICIT)
+        edge1.metadata["k"] = "v"
+        
+        assert edge2.metadata == {}
+    
+    def test_slotted_types_copy(self):
+        """Test that copy, deepcopy and dataclasses.replace work on slotted types."""
+        node = Node("A", NodeKind.VARIABLE, "derived", metadata={"k": ["v"]})
+        edge = Edge("A", "B", DependencyType.EXPLICIT, line_number=3)
+        
+        node_copy = copy.copy(node)
+        assert node_copy == node and node_copy is not node
+        assert node_copy.metadata is node.metadata
+        node_deep = copy.deepcopy(node)
+        assert node_deep == node
+        assert node_deep.metadata["k"] is not node.metadata["k"]
+        assert copy.copy(edge) == edge
+        assert dataclasses.replace(edge, to_node="C") == Edge(
+            "A", "C", DependencyType.EXPLICIT, line_number=3
+        )
+        assert not hasattr(dataclasses.replace(node, source="user_input"), "__dict__")
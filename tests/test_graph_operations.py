@@ -86,6 +86,36 @@ class TestExecutionOrder:
         assert "B" in layers[1]  # B depends on A
         assert "C" in layers[2]  # C depends on B
     
+    def test_execution_order_matches_topological_sort(self):
+        """Test layers follow longest dependency chains and agree with topo order."""
+        nodes = {name: Node(name, NodeKind.VARIABLE, "derived") for name in "ABCDE"}
+        edges = [
+            Edge("A", "B", DependencyType.IMPLICIT),
+            Edge("B", "C", DependencyType.IMPLICIT),
+            Edge("A", "C", DependencyType.IMPLICIT),  # C waits for B, not just A
+            Edge("D", "E", DependencyType.IMPLICIT),
+        ]
+        graph = DependencyGraph(nodes, edges)
+        
+        layers = get_execution_order(graph)
+        
+        assert [set(layer) for layer in layers] == [{"A", "D"}, {"B", "E"}, {"C"}]
+        assert [name for layer in layers for name in layer] == topological_sort(graph)
+    
+    def test_get_execution_order_with_start_nodes(self):
+        """Test explicit start nodes form the first layer."""
+        nodes = {name: Node(name, NodeKind.VARIABLE, "derived") for name in "ABCD"}
+        edges = [
+            Edge("A", "B", DependencyType.IMPLICIT),
+            Edge("B", "C", DependencyType.IMPLICIT),
+        ]
+        graph = DependencyGraph(nodes, edges)
+        
+        layers = get_execution_order(graph, start_nodes=["B"])
+        
+        # A and D have no dependencies, so they follow the start layer
+        assert [set(layer) for layer in layers] == [{"B"}, {"A", "C", "D"}]
+    
     def test_get_execution_order_method_on_graph(self):
         """Test get_execution_order method on DependencyGraph."""
         nodes = {"A": Node("A", NodeKind.VARIABLE, "derived")}
@@ -3,6 +3,7 @@ Tests for GraphQL schema and queries.
 """
 
 import pytest
+from unittest.mock import patch
 from docassemble_dag.graph import DependencyGraph
 from docassemble_dag.types import Node, NodeKind, Edge, DependencyType
 from docassemble_dag.graphql.schema import create_schema
@@ -146,3 +147,26 @@ class TestGraphQLSchema:
         result = schema.execute_sync(query, context_value={"graph": sample_graph})
         assert result.errors is None
         assert result.data["nodesByAuthority"][0]["name"] == "eligible"
+
+    @pytest.mark.parametrize("cache_size, expected_calls", [(None, 1), (0, 2)])
+    def test_repeated_lookups_share_operation_cache(self, sample_graph, cache_size, expected_calls):
+        """Test equal lookups within one operation hit the graph once."""
+        schema = create_schema(cache_size=cache_size)
+        query = """
+            query {
+                first: path(from: "age", to: "eligible") { nodes }
+                second: path(from: "age", to: "eligible") { nodes }
+                other: path(from: "income", to: "eligible") { nodes }
+            }
+        """
+        context = {"graph": sample_graph}
+        with patch.object(sample_graph, "find_path", wraps=sample_graph.find_path) as find_path:
+            result = schema.execute_sync(query, context_value=context)
+        
+        assert result.errors is None
+        assert result.data["first"] == result.data["second"]
+        assert result.data["other"]["nodes"] == ["income", "eligible"]
+        age_calls = [c for c in find_path.call_args_list if c.args == ("age", "eligible")]
+        assert len(age_calls) == expected_calls
+        # The cache lives only for the operation
+        assert "graph_cache" not in context
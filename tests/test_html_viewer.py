@@ -2,6 +2,8 @@
 Tests for HTML interactive viewer.
 """
 
+import json
+
 import pytest
 from pathlib import Path
 from tempfile import NamedTemporaryFile
@@ -29,6 +31,23 @@ class TestHTMLViewer:
         assert "d3.js" in html.lower() or "d3js" in html.lower()
         assert "graphData" in html
     
+    def test_embedded_graph_data_is_compact_json(self):
+        """Test the embedded graph data is the graph's compact JSON."""
+        nodes = {
+            "x": Node("x", NodeKind.VARIABLE, "derived"),
+            "y": Node("y", NodeKind.VARIABLE, "derived"),
+        }
+        graph = DependencyGraph(nodes, [Edge("x", "y", DependencyType.IMPLICIT)])
+        
+        html = to_html(graph)
+        
+        line = next(
+            line_text for line_text in html.splitlines() if "const graphData = " in line_text
+        )
+        payload = line.split("const graphData = ", 1)[1].rstrip(";")
+        assert json.loads(payload) == json.loads(graph.to_json_bytes())
+        assert '", "' not in payload
+    
     def test_generate_html_with_title(self):
         """Test generating HTML with custom title."""
         nodes = {"x": Node("x", NodeKind.VARIABLE, "derived")}
@@ -4,6 +4,10 @@ Combines all original tests, multi-document logic, framework-specific edge cases
 Python AST extraction, and filesystem mocking into a single file.
 """
 
+import os
+import subprocess
+import sys
+
 import pytest
 import yaml
 from unittest.mock import patch, mock_open
@@ -159,6 +163,22 @@ rules:
         assert nodes["test_var"].authority == "Test Statute § 123"
         assert nodes["test_rule"].authority == "Another Law § 456"
 
+    def test_names_and_authorities_are_interned(self):
+        """Test that repeated names and citations share one string object."""
+        yaml_text = """
+variables:
+  - name: income
+    authority: "Tax Code § 1"
+  - name: tax_owed
+    authority: "Tax Code § 1"
+    expression: income * 0.1
+"""
+        parser = DocassembleParser(yaml_text)
+        nodes = parser.extract_nodes()
+        edges = parser.extract_edges(nodes)
+        assert nodes["income"].authority is nodes["tax_owed"].authority
+        assert [(e.from_node, e.to_node) for e in edges] == [("income", "tax_owed")]
+
     def test_no_duplicate_edges(self):
         """Test that duplicate edges are not created."""
         yaml_text = """
@@ -199,6 +219,27 @@ variables:
         for node in nodes.values():
             assert node.line_number is None or isinstance(node.line_number, int)
 
+    def test_line_numbers_use_first_matching_line(self):
+        """Test line numbers for plain, quoted and repeated names."""
+        yaml_text = (
+            "variables:\n"
+            "  - name: income\n"
+            "    expression: wages\n"
+            "  - name: 'wages'\n"
+            "  - name: total\n"
+            "    expression: income\n"
+            "questions:\n"
+            "  - name: ask_total\n"
+            "    question: \"total\""
+        )
+        parser = DocassembleParser(yaml_text)
+        nodes = parser.extract_nodes()
+        assert nodes["income"].line_number == 2
+        assert nodes["wages"].line_number == 4
+        assert nodes["total"].line_number == 5
+        assert nodes["ask_total"].line_number == 8
+        assert parser._find_line_number_by_name("missing") is None
+
     def test_edges_have_metadata(self):
         """Test that edges include metadata when available."""
         yaml_text = "variables:\n  - name: a\n  - name: b\n    expression: a"
@@ -232,6 +273,54 @@ variables:
         nodes = parser.extract_nodes()
         assert "v1" in nodes and "v2" in nodes
 
+    def test_parser_accepts_pre_parsed_yaml(self):
+        """Test that a pre-parsed dict is used instead of re-parsing the text."""
+        yaml_text = "variables:\n  - name: v1\n  - name: v2\n    expression: v1 * 2"
+        parsed = merge_yaml_documents(parse_multi_document_yaml(yaml_text))
+        with patch("docassemble_dag.parser.parse_multi_document_yaml") as mock_parse:
+            parser = DocassembleParser(yaml_text, parsed=parsed)
+            mock_parse.assert_not_called()
+        nodes = parser.extract_nodes()
+        edges = parser.extract_edges(nodes)
+        assert set(nodes) == {"v1", "v2"}
+        assert [(e.from_node, e.to_node) for e in edges] == [("v1", "v2")]
+        assert nodes["v1"].line_number == 2
+
+    def test_extraction_is_memoized_by_content(self):
+        """Test that identical YAML reuses extracted nodes and edges."""
+        yaml_text = "variables:\n  - name: memo_a\n  - name: memo_b\n    expression: memo_a + 1"
+        first = DocassembleParser(yaml_text, file_path="memo.yaml")
+        nodes = first.extract_nodes()
+        edges = first.extract_edges(nodes)
+        nodes["scratch"] = None  # Callers get their own dict
+        # ... and their own Node/Edge objects
+        nodes["memo_a"].authority = "EDITED"
+        nodes["memo_a"].metadata["x"] = 1
+        edges[0].metadata["x"] = 1
+        
+        second = DocassembleParser(yaml_text, file_path="memo.yaml")
+        with patch.object(DocassembleParser, "_extract_nodes") as mock_nodes, \
+                patch.object(DocassembleParser, "_extract_edges") as mock_edges:
+            cached_nodes = second.extract_nodes()
+            cached_edges = second.extract_edges(cached_nodes)
+            mock_nodes.assert_not_called()
+            mock_edges.assert_not_called()
+        
+        assert set(cached_nodes) == {"memo_a", "memo_b"}
+        assert cached_nodes["memo_a"] is not nodes["memo_a"]
+        assert cached_nodes["memo_a"].authority is None
+        assert cached_nodes["memo_a"].metadata == {}
+        assert [(e.from_node, e.to_node) for e in cached_edges] == [("memo_a", "memo_b")]
+        assert cached_edges[0] is not edges[0]
+        assert cached_edges[0].metadata == {}
+        
+        # Edges for a different node set are recomputed
+        assert second.extract_edges({"memo_b": cached_nodes["memo_b"]}) == []
+        
+        # A different file path is a different cache entry
+        other = DocassembleParser(yaml_text, file_path="other.yaml")
+        assert other.extract_nodes()["memo_a"].file_path == "other.yaml"
+    
     # --- SECTION 3: FRAMEWORK & EDGE CASE TESTS ---
 
     def test_assembly_line_detection(self):
@@ -299,6 +388,19 @@ variables:
         nodes = parser.extract_nodes()
         assert "user_name" in nodes
 
+    @pytest.mark.parametrize("disable, expected", [("", "CSafeLoader"), ("1", "SafeLoader")])
+    def test_disable_cloader_env_var(self, disable, expected):
+        """Test DAG_DISABLE_CLOADER selects the pure-Python YAML loader."""
+        if not disable and not hasattr(yaml, "CSafeLoader"):
+            pytest.skip("PyYAML built without libyaml")
+        env = dict(os.environ, DAG_DISABLE_CLOADER=disable)
+        result = subprocess.run(
+            [sys.executable, "-c",
+             "from docassemble_dag import parser; print(parser._SafeLoader.__name__)"],
+            env=env, capture_output=True, text=True, check=True,
+        )
+        assert result.stdout.strip() == expected
+
     def test_invalid_yaml_raises_error(self):
         """Test that corrupted YAML raises InvalidYAMLError."""
         with pytest.raises(InvalidYAMLError):
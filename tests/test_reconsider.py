@@ -2,6 +2,8 @@
 Tests for reconsider directive tracking.
 """
 
+import sys
+
 import pytest
 from docassemble_dag.reconsider import (
     ReconsiderDirective,
@@ -48,6 +50,26 @@ class TestReconsiderDirectives:
         reconsidered_vars = {d.reconsidered_var for d in directives}
         assert "y" in reconsidered_vars
         assert "z" in reconsidered_vars
+    
+    def test_directive_names_are_interned(self):
+        """Test that directive names share storage with equal interned strings."""
+        name = "".join(["reconsidered", "_var"])
+        directive = ReconsiderDirective("node", name)
+        
+        assert directive.reconsidered_var is sys.intern("reconsidered_var")
+    
+    def test_extract_no_reconsider(self):
+        """Test files without reconsider directives or item sections."""
+        assert extract_reconsider_directives({"metadata": {"title": "x"}}) == []
+        assert extract_reconsider_directives({"variables": [{"name": "x"}, "bad"]}) == []
+    
+    def test_extract_reconsider_colon_key(self):
+        """Test the alternative 'reconsider:' key spelling."""
+        yaml_dict = {"questions": [{"name": "q", "reconsider:": "y"}]}
+        
+        directives = extract_reconsider_directives(yaml_dict)
+        
+        assert [(d.node_name, d.reconsidered_var) for d in directives] == [("q", "y")]
 
 
 class TestReconsiderBoundaries:
@@ -76,6 +98,16 @@ class TestReconsiderBoundaries:
         assert len(warnings) >= 1
         assert any(w["from_node"] == "x" for w in warnings)
     
+    def test_check_reconsider_boundaries_no_directives(self):
+        """Test that no warnings are produced without reconsider directives."""
+        nodes = {
+            "x": Node("x", NodeKind.VARIABLE, "derived"),
+            "y": Node("y", NodeKind.VARIABLE, "derived"),
+        }
+        graph = DependencyGraph(nodes, [Edge("x", "y", DependencyType.IMPLICIT)])
+        
+        assert check_reconsider_boundaries(graph, []) == []
+    
     def test_get_reconsidered_variables(self):
         """Test getting set of reconsidered variables."""
         directives = [
@@ -87,3 +119,19 @@ class TestReconsiderBoundaries:
         
         assert "x" in reconsidered
         assert "y" in reconsidered
+        assert isinstance(reconsidered, frozenset)
+    
+    def test_check_reconsider_boundaries_with_frozenset(self):
+        """Test passing a pre-built frozenset of reconsidered variables."""
+        nodes = {
+            "x": Node("x", NodeKind.VARIABLE, "derived"),
+            "y": Node("y", NodeKind.VARIABLE, "derived"),
+        }
+        graph = DependencyGraph(nodes, [Edge("x", "y", DependencyType.IMPLICIT)])
+        directives = [ReconsiderDirective("some_node", "x")]
+        
+        from_list = check_reconsider_boundaries(graph, directives)
+        from_set = check_reconsider_boundaries(graph, get_reconsidered_variables(directives))
+        
+        assert from_set == from_list
+        assert len(from_set) == 1
@@ -2,6 +2,7 @@
 Tests for utility functions (utils.py).
 """
 
+import os
 import pytest
 from pathlib import Path
 from tempfile import TemporaryDirectory, NamedTemporaryFile
@@ -10,7 +11,9 @@ from docassemble_dag.utils import (
     merge_graphs,
     parse_multiple_files,
     find_nodes_by_authority,
+    find_nodes_by_authorities,
     parse_with_includes,
+    parse_include_directives,
 )
 from docassemble_dag.graph import DependencyGraph
 from docassemble_dag.types import Node, NodeKind, Edge, DependencyType
@@ -53,6 +56,17 @@ class TestFindYAMLFiles:
             files_non_recursive = find_yaml_files(Path(tmpdir), recursive=False)
             assert len(files_non_recursive) == 1
     
+    def test_find_yaml_ignores_other_files(self):
+        """Test that non-YAML files are skipped and results are sorted."""
+        with TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "b.yml").write_text("variables:\n  - name: x\n")
+            (Path(tmpdir) / "a.yaml").write_text("variables:\n  - name: y\n")
+            (Path(tmpdir) / "notes.txt").write_text("not yaml")
+            (Path(tmpdir) / "dir.yaml").mkdir()
+            
+            files = find_yaml_files(Path(tmpdir))
+            assert [f.name for f in files] == ["a.yaml", "b.yml"]
+    
     def test_find_yaml_empty_directory(self):
         """Test finding YAML files in empty directory."""
         with TemporaryDirectory() as tmpdir:
@@ -126,6 +140,20 @@ class TestMergeGraphs:
         assert merged.edges[0].from_node == "x"
         assert merged.edges[0].to_node == "y"
     
+    def test_merge_graphs_dedupes_edges(self):
+        """Test that repeated edges are kept once, first occurrence winning."""
+        nodes = {
+            "x": Node("x", NodeKind.VARIABLE, "derived"),
+            "y": Node("y", NodeKind.VARIABLE, "derived"),
+        }
+        graph1 = DependencyGraph(dict(nodes), [Edge("x", "y", DependencyType.EXPLICIT)])
+        graph2 = DependencyGraph(dict(nodes), [Edge("x", "y", DependencyType.IMPLICIT)])
+        
+        merged = merge_graphs([graph1, graph2])
+        
+        assert len(merged.edges) == 1
+        assert merged.edges[0].dep_type == DependencyType.EXPLICIT
+    
     def test_merge_single_graph(self):
         """Test merging a single graph."""
         graph = DependencyGraph(
@@ -181,6 +209,22 @@ class TestFindNodesByAuthority:
         matches = find_nodes_by_authority(graph, "NONEXISTENT")
         assert len(matches) == 0
     
+    def test_find_nodes_repeated_queries(self):
+        """Test that repeated queries reuse the graph's authority index."""
+        graph = DependencyGraph(
+            {
+                "x": Node("x", NodeKind.VARIABLE, "derived", authority="CPLR 123"),
+                "y": Node("y", NodeKind.VARIABLE, "derived", authority="Family Court Act"),
+                "z": Node("z", NodeKind.VARIABLE, "derived"),
+            },
+            []
+        )
+        
+        assert [n.name for n in find_nodes_by_authority(graph, "cplr")] == ["x"]
+        index = graph.get_authority_index()
+        assert [n.name for n in find_nodes_by_authority(graph, "FAMILY")] == ["y"]
+        assert graph.get_authority_index() is index
+    
     def test_find_nodes_no_authority(self):
         """Test finding nodes when no nodes have authority."""
         graph = DependencyGraph(
@@ -194,6 +238,34 @@ class TestFindNodesByAuthority:
         assert len(matches) == 0
 
 
+class TestFindNodesByAuthorities:
+    """Test find_nodes_by_authorities utility."""
+    
+    def test_find_nodes_by_multiple_patterns(self):
+        """Test matching any of several case-insensitive patterns."""
+        graph = DependencyGraph(
+            {
+                "x": Node("x", NodeKind.VARIABLE, "derived", authority="CPLR 123"),
+                "y": Node("y", NodeKind.VARIABLE, "derived", authority="RPAPL § 711"),
+                "z": Node("z", NodeKind.VARIABLE, "derived", authority="Straße Code"),
+                "w": Node("w", NodeKind.VARIABLE, "derived"),
+            },
+            []
+        )
+        
+        matches = find_nodes_by_authorities(graph, ["cplr", "§ 711", "STRASSE"])
+        assert [n.name for n in matches] == ["x", "y", "z"]
+    
+    def test_find_nodes_by_no_patterns(self):
+        """Test that an empty pattern list matches nothing."""
+        graph = DependencyGraph(
+            {"x": Node("x", NodeKind.VARIABLE, "derived", authority="CPLR 123")},
+            []
+        )
+        
+        assert find_nodes_by_authorities(graph, []) == []
+
+
 class TestParseMultipleFiles:
     """Test parse_multiple_files utility."""
     
@@ -211,6 +283,137 @@ class TestParseMultipleFiles:
             assert len(graph.nodes) >= 2
             assert any(node.name == "x" for node in graph.nodes.values())
             assert any(node.name == "y" for node in graph.nodes.values())
+    
+    def test_parse_multiple_files_dedupes_and_skips_invalid(self):
+        """Test that shared nodes/edges are merged once and bad files are skipped."""
+        with TemporaryDirectory() as tmpdir:
+            content = "variables:\n  - name: x\n  - name: y\n    expression: x + 1\n"
+            file1 = Path(tmpdir) / "file1.yaml"
+            file1.write_text(content)
+            file2 = Path(tmpdir) / "file2.yaml"
+            file2.write_text(content)
+            bad = Path(tmpdir) / "bad.yaml"
+            bad.write_text("variables: [unclosed\n")
+            
+            graph = parse_multiple_files([file1, bad, file2])
+            
+            assert set(graph.nodes) == {"x", "y"}
+            assert graph.nodes["x"].file_path == str(file1)
+            assert [(e.from_node, e.to_node) for e in graph.edges] == [("x", "y")]
+    
+    def test_parse_multiple_files_skips_malformed_shape(self, caplog):
+        """Test that YAML which loads but has an odd shape is skipped."""
+        with TemporaryDirectory() as tmpdir:
+            malformed = Path(tmpdir) / "malformed.yaml"
+            malformed.write_text("questions: [{name: q, variable: [a, b]}]\n")
+            good = Path(tmpdir) / "good.yaml"
+            good.write_text("variables:\n  - name: x\n")
+            
+            graph = parse_multiple_files([malformed, good])
+            
+            assert set(graph.nodes) == {"x"}
+            assert "malformed.yaml" in caplog.text
+    
+    def test_parse_single_file(self):
+        """Test the single-file fast path, including an unparseable file."""
+        with TemporaryDirectory() as tmpdir:
+            good = Path(tmpdir) / "good.yaml"
+            good.write_text("variables:\n  - name: x\n  - name: y\n    expression: x + 1\n")
+            bad = Path(tmpdir) / "bad.yaml"
+            bad.write_text("variables: [unclosed\n")
+            
+            graph = parse_multiple_files([good])
+            assert set(graph.nodes) == {"x", "y"}
+            assert len(graph.edges) == 1
+            
+            empty = parse_multiple_files([bad])
+            assert empty.nodes == {} and empty.edges == []
+    
+    def test_parse_multiple_files_skips_unreadable(self, caplog):
+        """Test that missing and non-UTF-8 files are logged and skipped."""
+        with TemporaryDirectory() as tmpdir:
+            good = Path(tmpdir) / "good.yaml"
+            good.write_text("variables:\n  - name: x\n")
+            binary = Path(tmpdir) / "binary.yaml"
+            binary.write_bytes(b"\xff\xfe\x00bad")
+            missing = Path(tmpdir) / "missing.yaml"
+            
+            graph = parse_multiple_files([good, binary, missing])
+            
+            assert set(graph.nodes) == {"x"}
+            assert "binary.yaml" in caplog.text
+            assert "missing.yaml" in caplog.text
+    
+    def test_parse_multiple_files_with_workers(self):
+        """Test that threaded parsing gives the same result as serial parsing."""
+        with TemporaryDirectory() as tmpdir:
+            files = []
+            for i in range(5):
+                path = Path(tmpdir) / f"file{i}.yaml"
+                path.write_text(
+                    f"variables:\n  - name: shared\n  - name: v{i}\n    expression: shared + {i}\n"
+                )
+                files.append(path)
+            
+            serial = parse_multiple_files(files)
+            threaded = parse_multiple_files(files, workers=4)
+            
+            assert list(threaded.nodes) == list(serial.nodes)
+            assert threaded.nodes["shared"].file_path == str(files[0])
+            assert [(e.from_node, e.to_node) for e in threaded.edges] == [
+                (e.from_node, e.to_node) for e in serial.edges
+            ]
+
+
+class TestParseIncludeDirectives:
+    """Test parse_include_directives utility."""
+    
+    def test_parse_include_and_modules(self):
+        """Test collecting include and modules entries."""
+        yaml_text = "include:\n  - a.yml\n  - b.yml\nmodules: docassemble.base.util\n"
+        
+        assert parse_include_directives(yaml_text) == ["a.yml", "b.yml", "docassemble.base.util"]
+    
+    def test_parse_include_returns_fresh_list(self):
+        """Test that cached results are not shared between callers."""
+        yaml_text = "include:\n  - a.yml\n"
+        first = parse_include_directives(yaml_text)
+        first.append("mutated.yml")
+        
+        assert parse_include_directives(yaml_text) == ["a.yml"]
+    
+    def test_parse_include_resolves_relative_to_base(self):
+        """Test resolving includes relative to the including file."""
+        with TemporaryDirectory() as tmpdir:
+            included = Path(tmpdir) / "a.yml"
+            included.write_text("variables: []\n")
+            main_file = Path(tmpdir) / "main.yml"
+            main_file.write_text("include: a.yml\n")
+            
+            includes = parse_include_directives("include: a.yml\n", base_path=main_file)
+            
+            assert includes == [str(included.resolve())]
+    
+    def test_parse_include_sees_created_file(self):
+        """Test that an include is resolved once its file appears."""
+        with TemporaryDirectory() as tmpdir:
+            main_file = Path(tmpdir) / "main.yml"
+            main_file.write_text("include: late.yml\n")
+            
+            assert parse_include_directives("include: late.yml\n", base_path=main_file) == [
+                "late.yml"
+            ]
+            
+            late = Path(tmpdir) / "late.yml"
+            late.write_text("variables: []\n")
+            
+            assert parse_include_directives("include: late.yml\n", base_path=main_file) == [
+                str(late.resolve())
+            ]
+    
+    def test_parse_include_invalid_yaml(self):
+        """Test that unparseable YAML yields no includes."""
+        assert parse_include_directives("include: [unclosed\n") == []
 
 
 class TestParseWithIncludes:
@@ -233,3 +436,78 @@ class TestParseWithIncludes:
             except Exception:
                 # If include resolution fails, that's expected without full Docassemble
                 pass
+    
+    def test_parse_with_includes_merges_included_nodes(self):
+        """Test that included files contribute nodes and are visited once."""
+        with TemporaryDirectory() as tmpdir:
+            included_file = Path(tmpdir) / "included.yaml"
+            included_file.write_text("variables:\n  - name: included_var\n")
+            
+            main_file = Path(tmpdir) / "main.yaml"
+            main_file.write_text("include:\n  - included.yaml\nvariables:\n  - name: main_var\n")
+            
+            graph, visited = parse_with_includes(main_file)
+            
+            assert {"main_var", "included_var"} <= set(graph.nodes)
+            assert str(included_file.resolve()) in visited
+    
+    def test_parse_with_includes_shared_include(self):
+        """Test a diamond of includes: shared file visited once, main file wins."""
+        with TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            (base / "shared.yaml").write_text(
+                "variables:\n  - name: x\n    authority: shared\n  - name: s\n"
+            )
+            (base / "a.yaml").write_text("include:\n  - shared.yaml\nvariables:\n  - name: a\n")
+            (base / "b.yaml").write_text("include:\n  - shared.yaml\nvariables:\n  - name: b\n")
+            main_file = base / "main.yaml"
+            main_file.write_text(
+                "include:\n  - a.yaml\n  - b.yaml\nvariables:\n  - name: x\n    authority: main\n"
+            )
+            
+            graph, visited = parse_with_includes(main_file)
+            
+            assert len(visited) == 4
+            assert {"x", "s", "a", "b"} <= set(graph.nodes)
+            assert graph.nodes["x"].authority == "main"
+    
+    def test_parse_with_includes_sees_edited_file(self):
+        """Test that re-parsing after an edit does not return stale results."""
+        with TemporaryDirectory() as tmpdir:
+            main_file = Path(tmpdir) / "main.yaml"
+            main_file.write_text("variables:\n  - name: old_var\n")
+            graph, _ = parse_with_includes(main_file)
+            assert "old_var" in graph.nodes
+            
+            main_file.write_text("variables:\n  - name: new_var\n")
+            stat = main_file.stat()
+            os.utime(main_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            graph, _ = parse_with_includes(main_file)
+            assert "new_var" in graph.nodes
+            assert "old_var" not in graph.nodes
+    
+    def test_parse_with_includes_picks_up_created_include(self):
+        """Test that an include missing at first parse is merged once it exists."""
+        with TemporaryDirectory() as tmpdir:
+            main_file = Path(tmpdir) / "main.yaml"
+            main_file.write_text("include:\n  - sub.yaml\nvariables:\n  - name: top\n")
+            graph, _ = parse_with_includes(main_file)
+            assert set(graph.nodes) == {"top"}
+            
+            (Path(tmpdir) / "sub.yaml").write_text("variables:\n  - name: from_sub\n")
+            graph, _ = parse_with_includes(main_file)
+            assert set(graph.nodes) == {"top", "from_sub"}
+    
+    def test_parse_with_includes_returns_private_nodes(self):
+        """Test that mutating one result does not leak into the next parse."""
+        with TemporaryDirectory() as tmpdir:
+            main_file = Path(tmpdir) / "main.yaml"
+            main_file.write_text("variables:\n  - name: top\n")
+            graph, _ = parse_with_includes(main_file)
+            graph.nodes["top"].authority = "MUT"
+            graph.nodes["top"].metadata["x"] = 1
+            
+            again, _ = parse_with_includes(main_file)
+            
+            assert again.nodes["top"].authority is None
+            assert "x" not in again.nodes["top"].metadata
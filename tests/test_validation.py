@@ -112,6 +112,61 @@ class TestGraphValidator:
         assert isinstance(violations, list)
         # All nodes in edges are defined, so no violations expected
     
+    def test_dangling_edges_reported_by_both_policies(self):
+        """Test missing-node policies share one scan and keep edge order."""
+        nodes = {"A": Node("A", NodeKind.VARIABLE, "derived")}
+        edges = [
+            Edge("ghost", "A", DependencyType.IMPLICIT),
+            Edge("A", "phantom", DependencyType.EXPLICIT),
+        ]
+        graph = DependencyGraph.from_trusted(nodes, edges)
+        validator = GraphValidator(graph)
+        
+        violations = validator.validate_all(
+            policies=["no_missing_dependencies", "no_undefined_references"]
+        )
+        
+        assert [(v.rule_name, v.node_name) for v in violations] == [
+            ("no_missing_dependencies", "A"),
+            ("no_missing_dependencies", "A"),
+            ("no_undefined_references", "A"),
+        ]
+        assert "ghost" in violations[0].message
+        assert "phantom" in violations[1].message
+    
+    def test_direct_checks_see_graph_edits(self):
+        """Test check_* methods called directly reflect later graph edits."""
+        nodes = {
+            "A": Node("A", NodeKind.VARIABLE, "user_input"),
+            "B": Node("B", NodeKind.VARIABLE, "derived"),
+        }
+        graph = DependencyGraph(nodes, [])
+        validator = GraphValidator(graph)
+        validator.validate_all(policies=["no_orphans"])
+        assert len(validator.violations) == 2
+        
+        graph.add_edge(Edge("A", "B", DependencyType.IMPLICIT))
+        validator.violations = []
+        validator.check_no_orphans()
+        validator.check_all_nodes_used()
+        
+        assert validator.violations == []
+    
+    def test_direct_dangling_edge_checks_are_not_cached(self):
+        """Test direct missing-node checks rescan edges on every call."""
+        nodes = {"A": Node("A", NodeKind.VARIABLE, "derived")}
+        edges = [Edge("ghost", "A", DependencyType.IMPLICIT)]
+        graph = DependencyGraph.from_trusted(nodes, edges)
+        validator = GraphValidator(graph)
+        validator.check_missing_dependencies()
+        assert len(validator.violations) == 1
+        
+        graph.remove_edge(edges[0])
+        validator.violations = []
+        validator.check_no_undefined_references()
+        
+        assert validator.violations == []
+    
     def test_get_summary(self):
         """Test summary generation."""
         nodes = {
@@ -130,6 +185,30 @@ class TestGraphValidator:
         assert "info" in summary
         assert summary["total"] == len(violations)
     
+    def test_get_critical_violations(self):
+        """Test only error-level critical rule violations are returned."""
+        nodes = {
+            "A": Node("A", NodeKind.VARIABLE, "derived"),
+            "B": Node("B", NodeKind.VARIABLE, "derived"),
+            "C": Node("C", NodeKind.VARIABLE, "user_input"),
+        }
+        edges = [
+            Edge("A", "B", DependencyType.EXPLICIT),
+            Edge("B", "A", DependencyType.EXPLICIT),
+        ]
+        
+        graph = DependencyGraph(nodes, edges)
+        validator = GraphValidator(graph)
+        assert validator.get_critical_violations() == []
+        
+        violations = validator.validate_all()
+        critical = validator.get_critical_violations()
+        
+        assert critical
+        assert all(v.rule_name == "no_cycles" for v in critical)
+        # The orphan warning for C is not critical
+        assert len(critical) < len(violations)
+    
     def test_to_dict(self):
         """Test conversion to dictionary."""
         nodes = {